@@ -0,0 +1,51 @@
+"""002_user_text_columns
+
+Revision ID: 002
+Revises: 001
+Create Date: 2026-10-15 00:00:00.000000
+
+Switches the free-form users columns from VARCHAR(n) to TEXT.
+Length limits remain enforced by the Pydantic schemas at the API edge.
+VARCHAR → TEXT is binary-compatible in PostgreSQL, so no table rewrite occurs.
+"""
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "002"
+down_revision: str | None = "001"
+branch_labels: str | None = None
+depends_on: str | None = None
+
+# column name → (previous length, nullable)
+_COLUMNS: dict[str, tuple[int, bool]] = {
+    "email": (255, False),
+    "username": (100, False),
+    "hashed_password": (255, False),
+    "full_name": (255, True),
+    "avatar_url": (500, True),
+}
+
+
+def upgrade() -> None:
+    for column, (length, nullable) in _COLUMNS.items():
+        op.alter_column(
+            "users",
+            column,
+            type_=sa.Text(),
+            existing_type=sa.String(length),
+            existing_nullable=nullable,
+        )
+
+
+def downgrade() -> None:
+    for column, (length, nullable) in _COLUMNS.items():
+        op.alter_column(
+            "users",
+            column,
+            type_=sa.String(length),
+            existing_type=sa.Text(),
+            existing_nullable=nullable,
+        )
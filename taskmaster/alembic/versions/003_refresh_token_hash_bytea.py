@@ -0,0 +1,41 @@
+"""003_refresh_token_hash_bytea
+
+Revision ID: 003
+Revises: 002
+Create Date: 2026-10-15 00:00:00.000000
+
+Stores users.refresh_token_hash as the raw 32-byte SHA-256 digest (BYTEA)
+instead of its 64-character hex encoding. Existing hashes are decoded in place.
+"""
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "003"
+down_revision: str | None = "002"
+branch_labels: str | None = None
+depends_on: str | None = None
+
+
+def upgrade() -> None:
+    op.alter_column(
+        "users",
+        "refresh_token_hash",
+        type_=sa.LargeBinary(32),
+        existing_type=sa.String(64),
+        existing_nullable=True,
+        postgresql_using="decode(refresh_token_hash, 'hex')",
+    )
+
+
+def downgrade() -> None:
+    op.alter_column(
+        "users",
+        "refresh_token_hash",
+        type_=sa.String(64),
+        existing_type=sa.LargeBinary(32),
+        existing_nullable=True,
+        postgresql_using="encode(refresh_token_hash, 'hex')",
+    )
@@ -0,0 +1,51 @@
+"""004_gin_indexes
+
+Revision ID: 004
+Revises: 003
+Create Date: 2026-10-15 00:00:00.000000
+
+Adds GIN indexes for containment queries on tasks.tags (ARRAY) and
+activity_logs.meta (JSONB, using the smaller jsonb_path_ops operator class).
+Both are built CONCURRENTLY, outside the migration transaction, so writes to
+these large tables are not blocked while the indexes build.
+"""
+from __future__ import annotations
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "004"
+down_revision: str | None = "003"
+branch_labels: str | None = None
+depends_on: str | None = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_tasks_tags_gin",
+            "tasks",
+            ["tags"],
+            postgresql_using="gin",
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_activity_logs_meta_gin",
+            "activity_logs",
+            ["meta"],
+            postgresql_using="gin",
+            postgresql_ops={"meta": "jsonb_path_ops"},
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_activity_logs_meta_gin",
+            table_name="activity_logs",
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_tasks_tags_gin", table_name="tasks", postgresql_concurrently=True
+        )
@@ -4,6 +4,7 @@ Admin-only dashboard routes.
 from __future__ import annotations
 
 from fastapi import APIRouter, Query
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 
 from app.core.dependencies import AdminUser, DBSession
@@ -88,7 +89,7 @@ async def list_all_tasks(
     page: int = Query(default=1, ge=1),
     size: int = Query(default=20, ge=1, le=100),
     include_archived: bool = Query(default=False),
-) -> PaginatedResponse[TaskRead]:
+) -> StreamingResponse:
     from app.schemas.task import TaskFilter
 
     filters = TaskFilter(
@@ -97,9 +98,9 @@ async def list_all_tasks(
         size=size,
     )
     tasks, total = await crud_task.list_with_filters(db, filters=filters)
-    return PaginatedResponse(
-        items=[TaskRead.model_validate(t) for t in tasks],
-        total=total,
-        page=page,
-        size=size,
+    return StreamingResponse(
+        PaginatedResponse.stream(
+            tasks, total=total, page=page, size=size, schema=TaskRead
+        ),
+        media_type="application/json",
     )
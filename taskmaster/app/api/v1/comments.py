@@ -12,6 +12,7 @@ from app.core.dependencies import CurrentUser, DBSession
 from app.core.exceptions import ForbiddenException, NotFoundException
 from app.crud.comment import crud_comment
 from app.crud.task import crud_task
+from app.models.notification import Notification
 from app.schemas.comment import CommentCreate, CommentRead, CommentUpdate
 from app.schemas.pagination import PaginatedResponse
 from app.services.activity_service import activity_service
@@ -71,23 +72,27 @@ async def create_comment(
     )
 
     # Notify task owner if commenter is different
+    notifications: list[Notification] = []
     if task.owner_id != current_user.id:
-        await notification_service.notify_comment_added(
-            db,
-            task_owner_id=task.owner_id,
-            task_id=task_id,
-            task_title=task.title,
-            commenter_name=current_user.username,
+        notifications.append(
+            notification_service.comment_added(
+                task_owner_id=task.owner_id,
+                task_id=task_id,
+                task_title=task.title,
+                commenter_name=current_user.username,
+            )
         )
 
-    await activity_service.log(
-        db,
+    log_entry = activity_service.build_entry(
         user_id=current_user.id,
         action="comment_created",
         entity_type="comment",
         entity_id=comment.id,
         meta={"task_id": str(task_id)},
     )
+    db.add_all([*notifications, log_entry])
+    await db.flush()
+    notification_service.push(notifications)
 
     result = await crud_comment.get_with_author(db, comment.id)
     return CommentRead.model_validate(result)
@@ -8,6 +8,7 @@ import uuid
 from typing import Annotated
 
 from fastapi import APIRouter, Depends, Query, status
+from fastapi.responses import StreamingResponse
 
 from app.core.dependencies import CurrentUser, DBSession
 from app.crud.task import crud_task
@@ -63,15 +64,19 @@ async def list_tasks(
     current_user: CurrentUser,
     db: DBSession,
     filters: Annotated[TaskFilter, Depends(_task_filter_params)],
-) -> PaginatedResponse[TaskRead]:
+) -> StreamingResponse:
     tasks, total = await task_service.list_tasks(
         db, filters=filters, current_user=current_user
     )
-    return PaginatedResponse(
-        items=[TaskRead.model_validate(t) for t in tasks],
-        total=total,
-        page=filters.page,
-        size=filters.size,
+    return StreamingResponse(
+        PaginatedResponse.stream(
+            tasks,
+            total=total,
+            page=filters.page,
+            size=filters.size,
+            schema=TaskRead,
+        ),
+        media_type="application/json",
     )
 
 
@@ -102,7 +107,7 @@ async def list_team_tasks(
     page: int = Query(default=1, ge=1),
     size: int = Query(default=20, ge=1, le=100),
     include_archived: bool = Query(default=False),
-) -> PaginatedResponse[TaskRead]:
+) -> StreamingResponse:
     tasks, total = await crud_task.list_by_team(
         db,
         team_id=team_id,
@@ -110,11 +115,11 @@ async def list_team_tasks(
         limit=size,
         include_archived=include_archived,
     )
-    return PaginatedResponse(
-        items=[TaskRead.model_validate(t) for t in tasks],
-        total=total,
-        page=page,
-        size=size,
+    return StreamingResponse(
+        PaginatedResponse.stream(
+            tasks, total=total, page=page, size=size, schema=TaskRead
+        ),
+        media_type="application/json",
     )
 
 
@@ -12,7 +12,7 @@ from fastapi import APIRouter, WebSocket, WebSocketDisconnect
 from jose import JWTError
 
 from app.core.security import decode_access_token
-from app.services.websocket_service import ws_manager
+from app.services.websocket_service import PING_FRAME, ws_manager
 
 logger = logging.getLogger(__name__)
 
@@ -81,7 +81,7 @@ async def websocket_endpoint(websocket: WebSocket, user_id: str) -> None:
     except Exception as exc:
         logger.error("WebSocket error for user_id=%s: %s", user_id, exc)
     finally:
-        ws_manager.disconnect(websocket, user_id)
+        ws_manager.disconnect(websocket)
 
 
 async def _heartbeat(websocket: WebSocket, user_id: str) -> None:
@@ -89,6 +89,6 @@ async def _heartbeat(websocket: WebSocket, user_id: str) -> None:
     while True:
         await asyncio.sleep(HEARTBEAT_INTERVAL)
         try:
-            await websocket.send_json({"type": "ping"})
+            await websocket.send_text(PING_FRAME)
         except Exception:
             break
@@ -45,6 +45,11 @@ class Settings(BaseSettings):
     # ── Rate Limiting ─────────────────────────────────────────────────────────
     RATE_LIMIT_LOGIN: str = "5/minute"
 
+    # ── Notifications ─────────────────────────────────────────────────────────
+    # Repeat "task updated" notifications for the same user and task are
+    # skipped while an unread one younger than this exists (0 disables).
+    NOTIFICATION_COALESCE_SECONDS: int = 60
+
     @field_validator("ALLOWED_ORIGINS", mode="before")
     @classmethod
     def parse_allowed_origins(cls, v: Any) -> list[str]:
@@ -95,9 +95,9 @@ def decode_refresh_token(token: str) -> dict[str, Any]:
     return payload
 
 
-def hash_token(token: str) -> str:
-    """Return a SHA-256 hex digest of a token for safe DB storage."""
-    return hashlib.sha256(token.encode()).hexdigest()
+def hash_token(token: str) -> bytes:
+    """Return the raw SHA-256 digest of a token for safe DB storage."""
+    return hashlib.sha256(token.encode()).digest()
 
 
 # ── Password policy ───────────────────────────────────────────────────────────
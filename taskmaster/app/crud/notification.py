@@ -4,6 +4,7 @@ Notification CRUD operations.
 from __future__ import annotations
 
 import uuid
+from datetime import datetime
 
 from sqlalchemy import func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -95,6 +96,30 @@ class CRUDNotification(CRUDBase[Notification, NotificationRead, NotificationRead
         )
         return result.rowcount  # type: ignore[return-value]
 
+    async def get_recent_unread(
+        self,
+        db: AsyncSession,
+        *,
+        user_id: uuid.UUID,
+        type: str,
+        reference_id: uuid.UUID,
+        since: datetime,
+    ) -> Notification | None:
+        """The newest unread notification of this type and reference since `since`."""
+        result = await db.execute(
+            select(Notification)
+            .where(
+                Notification.user_id == user_id,
+                Notification.is_read.is_(False),
+                Notification.type == type,
+                Notification.reference_id == reference_id,
+                Notification.created_at >= since,
+            )
+            .order_by(Notification.created_at.desc())
+            .limit(1)
+        )
+        return result.scalar_one_or_none()
+
     async def count_unread(self, db: AsyncSession, *, user_id: uuid.UUID) -> int:
         result = await db.execute(
             select(func.count())
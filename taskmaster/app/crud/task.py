@@ -7,26 +7,34 @@ from __future__ import annotations
 import uuid
 from datetime import datetime
 
-from sqlalchemy import func, or_, select
+from sqlalchemy import func, or_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import joinedload, selectinload
 
 from app.crud.base import CRUDBase
 from app.models.task import Task
+from app.models.team import Team, TeamMember
 from app.schemas.task import TaskCreate, TaskFilter, TaskUpdate
 
 
 class CRUDTask(CRUDBase[Task, TaskCreate, TaskUpdate]):
 
     async def get_with_relations(
-        self, db: AsyncSession, task_id: uuid.UUID
+        self, db: AsyncSession, task_id: uuid.UUID, *, with_members: bool = True
     ) -> Task | None:
-        """Fetch a task with owner and assignee eagerly loaded."""
-        result = await db.execute(
+        """
+        Fetch a task with owner and assignee eagerly loaded.
+        With with_members, the team and its members are loaded too, so
+        permission checks need no further queries.
+        """
+        query = (
             select(Task)
-            .options(selectinload(Task.owner), selectinload(Task.assignee))
+            .options(joinedload(Task.owner), joinedload(Task.assignee))
             .where(Task.id == task_id)
         )
+        if with_members:
+            query = query.options(selectinload(Task.team).selectinload(Team.members))
+        result = await db.execute(query)
         return result.scalar_one_or_none()
 
     async def create_task(
@@ -45,7 +53,7 @@ class CRUDTask(CRUDBase[Task, TaskCreate, TaskUpdate]):
             owner_id=owner_id,
             assigned_to_id=obj_in.assigned_to_id,
             team_id=obj_in.team_id,
-            tags=obj_in.tags or [],
+            tags=obj_in.tags,
         )
         db.add(task)
         await db.flush()
@@ -57,82 +65,74 @@ class CRUDTask(CRUDBase[Task, TaskCreate, TaskUpdate]):
         db: AsyncSession,
         *,
         filters: TaskFilter,
-        owner_id: uuid.UUID | None = None,
-        team_ids: list[uuid.UUID] | None = None,
+        user_id: uuid.UUID | None = None,
     ) -> tuple[list[Task], int]:
         """
         Return (tasks, total) applying all filter criteria.
-        If owner_id is provided, restricts to tasks owned by or assigned to that user.
-        If team_ids is provided, also includes tasks belonging to those teams.
+        If user_id is provided, restricts to tasks owned by or assigned to that
+        user, or belonging to a team the user owns or is a member of.
+        The page and the total come back from one statement via COUNT(*) OVER ().
         """
-        query = (
-            select(Task)
-            .options(selectinload(Task.owner), selectinload(Task.assignee))
-        )
-        count_query = select(func.count()).select_from(Task)
+        conditions = [Task.is_archived == filters.is_archived]
 
         # Ownership / visibility filter
-        if owner_id is not None:
-            conditions = [Task.owner_id == owner_id, Task.assigned_to_id == owner_id]
-            if team_ids:
-                conditions.append(Task.team_id.in_(team_ids))
-            visibility_filter = or_(*conditions)
-            query = query.where(visibility_filter)
-            count_query = count_query.where(visibility_filter)
-
-        # Archived filter
-        query = query.where(Task.is_archived == filters.is_archived)
-        count_query = count_query.where(Task.is_archived == filters.is_archived)
-
-        # Status filter
-        if filters.status is not None:
-            query = query.where(Task.status == filters.status)
-            count_query = count_query.where(Task.status == filters.status)
+        if user_id is not None:
+            conditions.append(
+                or_(
+                    Task.owner_id == user_id,
+                    Task.assigned_to_id == user_id,
+                    Task.team_id.in_(
+                        select(TeamMember.team_id).where(TeamMember.user_id == user_id)
+                    ),
+                    Task.team_id.in_(select(Team.id).where(Team.owner_id == user_id)),
+                )
+            )
 
-        # Priority filter
+        if filters.status is not None:
+            conditions.append(Task.status == filters.status)
         if filters.priority is not None:
-            query = query.where(Task.priority == filters.priority)
-            count_query = count_query.where(Task.priority == filters.priority)
-
-        # Assigned-to filter
+            conditions.append(Task.priority == filters.priority)
         if filters.assigned_to_id is not None:
-            query = query.where(Task.assigned_to_id == filters.assigned_to_id)
-            count_query = count_query.where(Task.assigned_to_id == filters.assigned_to_id)
-
-        # Team filter
+            conditions.append(Task.assigned_to_id == filters.assigned_to_id)
         if filters.team_id is not None:
-            query = query.where(Task.team_id == filters.team_id)
-            count_query = count_query.where(Task.team_id == filters.team_id)
+            conditions.append(Task.team_id == filters.team_id)
 
         # Due date range
         if filters.due_date_from is not None:
-            query = query.where(Task.due_date >= filters.due_date_from)
-            count_query = count_query.where(Task.due_date >= filters.due_date_from)
+            conditions.append(Task.due_date >= filters.due_date_from)
         if filters.due_date_to is not None:
-            query = query.where(Task.due_date <= filters.due_date_to)
-            count_query = count_query.where(Task.due_date <= filters.due_date_to)
+            conditions.append(Task.due_date <= filters.due_date_to)
 
         # Full-text search on title and description
         if filters.search:
             search_term = f"%{filters.search}%"
-            search_filter = or_(
-                Task.title.ilike(search_term),
-                Task.description.ilike(search_term),
+            conditions.append(
+                or_(
+                    Task.title.ilike(search_term),
+                    Task.description.ilike(search_term),
+                )
             )
-            query = query.where(search_filter)
-            count_query = count_query.where(search_filter)
 
-        # Count
-        total_result = await db.execute(count_query)
-        total = total_result.scalar_one()
-
-        # Paginate
         skip = (filters.page - 1) * filters.size
-        query = query.order_by(Task.created_at.desc()).offset(skip).limit(filters.size)
-
-        result = await db.execute(query)
-        tasks = list(result.scalars().all())
-        return tasks, total
+        result = await db.execute(
+            select(Task, func.count().over().label("total"))
+            .options(selectinload(Task.owner), selectinload(Task.assignee))
+            .where(*conditions)
+            .order_by(Task.created_at.desc())
+            .offset(skip)
+            .limit(filters.size)
+        )
+        rows = result.all()
+        if rows:
+            return [row[0] for row in rows], rows[0][1]
+        if skip == 0:
+            return [], 0
+
+        # Past the last page: the window count has no row to ride on
+        total_result = await db.execute(
+            select(func.count()).select_from(Task).where(*conditions)
+        )
+        return [], total_result.scalar_one()
 
     async def list_by_team(
         self,
@@ -169,6 +169,46 @@ class CRUDTask(CRUDBase[Task, TaskCreate, TaskUpdate]):
         await db.refresh(task)
         return task
 
+    async def assign(
+        self,
+        db: AsyncSession,
+        *,
+        task_id: uuid.UUID,
+        assignee_id: uuid.UUID,
+        actor_id: uuid.UUID | None = None,
+    ) -> Task | None:
+        """
+        Set the assignee with a single UPDATE … RETURNING.
+        If actor_id is provided, the row only matches when that user owns the
+        task or manages its team; None means no match (missing or forbidden).
+        """
+        conditions = [Task.id == task_id]
+        if actor_id is not None:
+            conditions.append(
+                or_(
+                    Task.owner_id == actor_id,
+                    Task.team_id.in_(
+                        select(TeamMember.team_id).where(
+                            TeamMember.user_id == actor_id,
+                            TeamMember.role == "manager",
+                        )
+                    ),
+                )
+            )
+        stmt = (
+            update(Task)
+            .where(*conditions)
+            .values(assigned_to_id=assignee_id)
+            .returning(Task)
+        )
+        result = await db.execute(
+            select(Task)
+            .from_statement(stmt)
+            .options(selectinload(Task.owner), selectinload(Task.assignee))
+            .execution_options(populate_existing=True)
+        )
+        return result.scalar_one_or_none()
+
     async def count_by_status(self, db: AsyncSession) -> dict[str, int]:
         """Return a dict mapping status → count for all non-archived tasks."""
         result = await db.execute(
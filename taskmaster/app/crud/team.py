@@ -7,7 +7,7 @@ import uuid
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import joinedload, selectinload
 
 from app.crud.base import CRUDBase
 from app.models.team import Team, TeamMember
@@ -16,22 +16,19 @@ from app.schemas.team import TeamCreate, TeamUpdate
 
 class CRUDTeam(CRUDBase[Team, TeamCreate, TeamUpdate]):
 
-    async def create_team(
-        self,
-        db: AsyncSession,
-        *,
-        obj_in: TeamCreate,
-        owner_id: uuid.UUID,
-    ) -> Team:
-        team = Team(
+    def build_team(self, *, obj_in: TeamCreate, owner_id: uuid.UUID) -> Team:
+        """
+        Build an unpersisted team with its owner already added as manager.
+        The id is assigned up front so callers can reference it (e.g. in an
+        activity log entry) and flush everything together.
+        """
+        return Team(
+            id=uuid.uuid4(),
             name=obj_in.name,
             description=obj_in.description,
             owner_id=owner_id,
+            members=[TeamMember(user_id=owner_id, role="manager")],
         )
-        db.add(team)
-        await db.flush()
-        await db.refresh(team)
-        return team
 
     async def get_with_members(
         self, db: AsyncSession, team_id: uuid.UUID
@@ -39,8 +36,8 @@ class CRUDTeam(CRUDBase[Team, TeamCreate, TeamUpdate]):
         result = await db.execute(
             select(Team)
             .options(
-                selectinload(Team.owner),
-                selectinload(Team.members).selectinload(TeamMember.user),
+                joinedload(Team.owner),
+                selectinload(Team.members).joinedload(TeamMember.user),
             )
             .where(Team.id == team_id)
         )
@@ -90,7 +87,7 @@ class CRUDTeam(CRUDBase[Team, TeamCreate, TeamUpdate]):
         member = TeamMember(team_id=team_id, user_id=user_id, role=role)
         db.add(member)
         await db.flush()
-        await db.refresh(member)
+        await db.refresh(member, attribute_names=["joined_at", "user"])
         return member
 
     async def remove_member(
@@ -117,23 +114,9 @@ class CRUDTeam(CRUDBase[Team, TeamCreate, TeamUpdate]):
         member.role = role
         db.add(member)
         await db.flush()
-        await db.refresh(member)
+        await db.refresh(member, attribute_names=["role", "joined_at", "user"])
         return member
 
-    async def get_user_team_ids(
-        self, db: AsyncSession, *, user_id: uuid.UUID
-    ) -> list[uuid.UUID]:
-        """Return all team IDs the user belongs to (as owner or member)."""
-        result = await db.execute(
-            select(Team.id)
-            .outerjoin(TeamMember, TeamMember.team_id == Team.id)
-            .where(
-                (Team.owner_id == user_id) | (TeamMember.user_id == user_id)
-            )
-            .distinct()
-        )
-        return [row[0] for row in result.all()]
-
     async def count_active_teams(self, db: AsyncSession) -> int:
         from sqlalchemy import func
         result = await db.execute(select(func.count()).select_from(Team))
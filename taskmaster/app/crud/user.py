@@ -6,7 +6,7 @@ from __future__ import annotations
 
 import uuid
 
-from sqlalchemy import select
+from sqlalchemy import exists, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.crud.base import CRUDBase
@@ -24,6 +24,19 @@ class CRUDUser(CRUDBase[User, UserCreate, UserUpdate]):
         result = await db.execute(select(User).where(User.username == username))
         return result.scalar_one_or_none()
 
+    async def find_conflict(
+        self, db: AsyncSession, *, email: str, username: str
+    ) -> tuple[bool, bool]:
+        """Return (email_taken, username_taken) in a single round trip."""
+        result = await db.execute(
+            select(
+                exists().where(User.email == email),
+                exists().where(User.username == username),
+            )
+        )
+        email_taken, username_taken = result.one()
+        return bool(email_taken), bool(username_taken)
+
     async def get_active_by_email(self, db: AsyncSession, email: str) -> User | None:
         result = await db.execute(
             select(User).where(User.email == email, User.is_active.is_(True))
@@ -53,7 +66,7 @@ class CRUDUser(CRUDBase[User, UserCreate, UserUpdate]):
         return user
 
     async def set_refresh_token_hash(
-        self, db: AsyncSession, *, user: User, token_hash: str | None
+        self, db: AsyncSession, *, user: User, token_hash: bytes | None
     ) -> User:
         user.refresh_token_hash = token_hash
         db.add(user)
@@ -5,7 +5,9 @@ Provides get_db dependency for FastAPI route injection.
 from __future__ import annotations
 
 from collections.abc import AsyncGenerator
+from typing import Any
 
+import orjson
 from sqlalchemy.ext.asyncio import (
     AsyncSession,
     async_sessionmaker,
@@ -15,8 +17,14 @@ from sqlalchemy.ext.asyncio import (
 from app.core.config import settings
 
 # ── Engine ────────────────────────────────────────────────────────────────────
+def json_serializer(value: Any) -> str:
+    """JSON columns (activity_logs.meta) accept UUIDs and datetimes as-is."""
+    return orjson.dumps(value).decode()
+
+
 engine = create_async_engine(
     settings.DATABASE_URL,
+    json_serializer=json_serializer,
     echo=settings.DEBUG,
     pool_pre_ping=True,
     pool_size=10,
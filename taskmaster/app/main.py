@@ -4,6 +4,7 @@ Configures lifespan, CORS, rate limiting, exception handlers, and routers.
 """
 from __future__ import annotations
 
+import asyncio
 import logging
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator
@@ -19,6 +20,7 @@ from app.api.v1.router import api_router
 from app.core.config import settings
 from app.core.exceptions import register_exception_handlers
 from app.db.session import engine
+from app.services.notification_service import notification_service
 
 logger = logging.getLogger(__name__)
 
@@ -34,8 +36,14 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     Runs startup logic before yield and teardown logic after.
     """
     logger.info("Starting %s v%s", settings.APP_NAME, settings.APP_VERSION)
+    push_worker = asyncio.create_task(notification_service.run_push_worker())
     yield
     logger.info("Shutting down %s", settings.APP_NAME)
+    push_worker.cancel()
+    try:
+        await push_worker
+    except asyncio.CancelledError:
+        pass
     await engine.dispose()
 
 
@@ -8,7 +8,7 @@ from __future__ import annotations
 import uuid
 from datetime import datetime
 
-from sqlalchemy import DateTime, ForeignKey, Index, String, func
+from sqlalchemy import JSON, DateTime, ForeignKey, Index, String, func
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -27,12 +27,14 @@ class ActivityLog(Base):
         UUID(as_uuid=True),
         ForeignKey("users.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
     )
     action: Mapped[str] = mapped_column(String(200), nullable=False)
     entity_type: Mapped[str] = mapped_column(String(100), nullable=False)
     entity_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), nullable=False)
-    meta: Mapped[dict | None] = mapped_column(JSONB, nullable=True)
+    # JSONB; plain JSON on the SQLite test database
+    meta: Mapped[dict | None] = mapped_column(
+        JSONB().with_variant(JSON(), "sqlite"), nullable=True
+    )
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         nullable=False,
@@ -50,6 +52,12 @@ class ActivityLog(Base):
         Index("ix_activity_logs_entity_type_id", "entity_type", "entity_id"),
         Index("ix_activity_logs_created_at", "created_at"),
         Index("ix_activity_logs_action", "action"),
+        Index(
+            "ix_activity_logs_meta_gin",
+            "meta",
+            postgresql_using="gin",
+            postgresql_ops={"meta": "jsonb_path_ops"},
+        ),
     )
 
     def __repr__(self) -> str:
@@ -26,7 +26,6 @@ class Notification(Base):
         UUID(as_uuid=True),
         ForeignKey("users.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
     )
     message: Mapped[str] = mapped_column(String(1000), nullable=False)
     type: Mapped[str] = mapped_column(
@@ -61,6 +60,10 @@ class Notification(Base):
         back_populates="notifications",
     )
 
+    # Load server-generated created_at in the INSERT itself so a flushed
+    # notification can be pushed over WebSocket without a refresh.
+    __mapper_args__ = {"eager_defaults": True}
+
     __table_args__ = (
         Index("ix_notifications_user_id", "user_id"),
         Index("ix_notifications_user_is_read", "user_id", "is_read"),
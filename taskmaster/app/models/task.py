@@ -8,7 +8,17 @@ from __future__ import annotations
 import uuid
 from datetime import datetime
 
-from sqlalchemy import Boolean, DateTime, Enum, ForeignKey, Index, String, Text, func
+from sqlalchemy import (
+    JSON,
+    Boolean,
+    DateTime,
+    Enum,
+    ForeignKey,
+    Index,
+    String,
+    Text,
+    func,
+)
 from sqlalchemy.dialects.postgresql import ARRAY, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -44,22 +54,20 @@ class Task(Base):
         UUID(as_uuid=True),
         ForeignKey("users.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
     )
     assigned_to_id: Mapped[uuid.UUID | None] = mapped_column(
         UUID(as_uuid=True),
         ForeignKey("users.id", ondelete="SET NULL"),
         nullable=True,
-        index=True,
     )
     team_id: Mapped[uuid.UUID | None] = mapped_column(
         UUID(as_uuid=True),
         ForeignKey("teams.id", ondelete="SET NULL"),
         nullable=True,
-        index=True,
     )
+    # Native array; plain JSON on the SQLite test database
     tags: Mapped[list[str] | None] = mapped_column(
-        ARRAY(String(100)),
+        ARRAY(String(100)).with_variant(JSON(), "sqlite"),
         nullable=True,
         default=list,
     )
@@ -97,11 +105,15 @@ class Task(Base):
         "Comment",
         back_populates="task",
         cascade="all, delete-orphan",
+        lazy="raise_on_sql",
+        passive_deletes=True,
     )
     attachments: Mapped[list["Attachment"]] = relationship(  # type: ignore[name-defined]  # noqa: F821
         "Attachment",
         back_populates="task",
         cascade="all, delete-orphan",
+        lazy="raise_on_sql",
+        passive_deletes=True,
     )
 
     __table_args__ = (
@@ -113,6 +125,7 @@ class Task(Base):
         Index("ix_tasks_assigned_to_id", "assigned_to_id"),
         Index("ix_tasks_is_archived", "is_archived"),
         Index("ix_tasks_status_priority", "status", "priority"),
+        Index("ix_tasks_tags_gin", "tags", postgresql_using="gin"),
     )
 
     def __repr__(self) -> str:
@@ -28,7 +28,6 @@ class Team(Base):
         UUID(as_uuid=True),
         ForeignKey("users.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
     )
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
@@ -51,12 +50,20 @@ class Team(Base):
         "TeamMember",
         back_populates="team",
         cascade="all, delete-orphan",
+        lazy="raise_on_sql",
+        passive_deletes=True,
     )
     tasks: Mapped[list["Task"]] = relationship(  # type: ignore[name-defined]  # noqa: F821
         "Task",
         back_populates="team",
+        lazy="raise_on_sql",
+        passive_deletes=True,
     )
 
+    # Load server-generated timestamps in the INSERT itself so a new team can
+    # be serialised straight after its flush.
+    __mapper_args__ = {"eager_defaults": True}
+
     __table_args__ = (Index("ix_teams_owner_id", "owner_id"),)
 
     def __repr__(self) -> str:
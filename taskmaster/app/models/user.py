@@ -7,7 +7,7 @@ from __future__ import annotations
 import uuid
 from datetime import datetime
 
-from sqlalchemy import Boolean, DateTime, Enum, Index, String, func
+from sqlalchemy import Boolean, DateTime, Enum, Index, LargeBinary, Text, func
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -28,20 +28,22 @@ class User(Base):
         default=uuid.uuid4,
         index=True,
     )
+    # Length limits are enforced by the Pydantic schemas; TEXT avoids a
+    # redundant varchar length check on every write.
     email: Mapped[str] = mapped_column(
-        String(255),
+        Text,
         unique=True,
         nullable=False,
         index=True,
     )
     username: Mapped[str] = mapped_column(
-        String(100),
+        Text,
         unique=True,
         nullable=False,
         index=True,
     )
-    hashed_password: Mapped[str] = mapped_column(String(255), nullable=False)
-    full_name: Mapped[str | None] = mapped_column(String(255), nullable=True)
+    hashed_password: Mapped[str] = mapped_column(Text, nullable=False)
+    full_name: Mapped[str | None] = mapped_column(Text, nullable=True)
     role: Mapped[str] = mapped_column(
         Enum("user", "admin", name="user_role_enum"),
         nullable=False,
@@ -54,8 +56,11 @@ class User(Base):
     is_verified: Mapped[bool] = mapped_column(
         Boolean, nullable=False, default=False, server_default="false"
     )
-    avatar_url: Mapped[str | None] = mapped_column(String(500), nullable=True)
-    refresh_token_hash: Mapped[str | None] = mapped_column(String(64), nullable=True)
+    avatar_url: Mapped[str | None] = mapped_column(Text, nullable=True)
+    # Raw SHA-256 digest (32 bytes) of the current refresh token
+    refresh_token_hash: Mapped[bytes | None] = mapped_column(
+        LargeBinary(32), nullable=True
+    )
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         nullable=False,
@@ -74,41 +79,57 @@ class User(Base):
         foreign_keys="Task.owner_id",
         back_populates="owner",
         cascade="all, delete-orphan",
+        lazy="raise_on_sql",
+        passive_deletes=True,
     )
     assigned_tasks: Mapped[list["Task"]] = relationship(  # type: ignore[name-defined]  # noqa: F821
         "Task",
         foreign_keys="Task.assigned_to_id",
         back_populates="assignee",
+        lazy="raise_on_sql",
+        passive_deletes=True,
     )
     owned_teams: Mapped[list["Team"]] = relationship(  # type: ignore[name-defined]  # noqa: F821
         "Team",
         back_populates="owner",
         cascade="all, delete-orphan",
+        lazy="raise_on_sql",
+        passive_deletes=True,
     )
     team_memberships: Mapped[list["TeamMember"]] = relationship(  # type: ignore[name-defined]  # noqa: F821
         "TeamMember",
         back_populates="user",
         cascade="all, delete-orphan",
+        lazy="raise_on_sql",
+        passive_deletes=True,
     )
     comments: Mapped[list["Comment"]] = relationship(  # type: ignore[name-defined]  # noqa: F821
         "Comment",
         back_populates="author",
         cascade="all, delete-orphan",
+        lazy="raise_on_sql",
+        passive_deletes=True,
     )
     attachments: Mapped[list["Attachment"]] = relationship(  # type: ignore[name-defined]  # noqa: F821
         "Attachment",
         back_populates="uploader",
         cascade="all, delete-orphan",
+        lazy="raise_on_sql",
+        passive_deletes=True,
     )
     notifications: Mapped[list["Notification"]] = relationship(  # type: ignore[name-defined]  # noqa: F821
         "Notification",
         back_populates="user",
         cascade="all, delete-orphan",
+        lazy="raise_on_sql",
+        passive_deletes=True,
     )
     activity_logs: Mapped[list["ActivityLog"]] = relationship(  # type: ignore[name-defined]  # noqa: F821
         "ActivityLog",
         back_populates="user",
         cascade="all, delete-orphan",
+        lazy="raise_on_sql",
+        passive_deletes=True,
     )
 
     __table_args__ = (
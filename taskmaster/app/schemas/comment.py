@@ -5,18 +5,21 @@ from __future__ import annotations
 
 import uuid
 from datetime import datetime
+from typing import Annotated
 
 from pydantic import BaseModel, Field
 
 from app.schemas.user import UserReadPublic
 
+CommentContent = Annotated[str, Field(min_length=1, max_length=10000)]
+
 
 class CommentCreate(BaseModel):
-    content: str = Field(min_length=1, max_length=10000)
+    content: CommentContent
 
 
 class CommentUpdate(BaseModel):
-    content: str = Field(min_length=1, max_length=10000)
+    content: CommentContent
 
 
 class CommentRead(BaseModel):
@@ -5,13 +5,20 @@ Used by all list endpoints to provide consistent pagination metadata.
 from __future__ import annotations
 
 import math
-from typing import Generic, TypeVar
+from collections.abc import AsyncIterator, Iterable
+from typing import Any, Generic, TypeVar
 
 from pydantic import BaseModel, computed_field
 
 T = TypeVar("T")
 
 
+def _page_count(total: int, size: int) -> int:
+    if size == 0:
+        return 0
+    return math.ceil(total / size)
+
+
 class PaginatedResponse(BaseModel, Generic[T]):
     """
     Generic paginated response wrapper.
@@ -26,8 +33,30 @@ class PaginatedResponse(BaseModel, Generic[T]):
     @computed_field  # type: ignore[misc]
     @property
     def pages(self) -> int:
-        if self.size == 0:
-            return 0
-        return math.ceil(self.total / self.size)
+        return _page_count(self.total, self.size)
 
     model_config = {"from_attributes": True}
+
+    @classmethod
+    async def stream(
+        cls,
+        items: Iterable[Any],
+        *,
+        total: int,
+        page: int,
+        size: int,
+        schema: type[BaseModel],
+    ) -> AsyncIterator[bytes]:
+        """
+        Yield the same JSON document as the model itself, one item at a time.
+        Each row is validated and encoded on its own, so only one schema
+        instance is alive at a time and the first bytes go out immediately.
+        """
+        yield b'{"items":['
+        for index, item in enumerate(items):
+            chunk = schema.model_validate(item).model_dump_json().encode()
+            yield chunk if index == 0 else b"," + chunk
+        yield (
+            f'],"total":{total},"page":{page},"size":{size},'
+            f'"pages":{_page_count(total, size)}}}'
+        ).encode()
@@ -6,7 +6,7 @@ from __future__ import annotations
 
 import uuid
 from datetime import datetime
-from typing import Literal
+from typing import Annotated, Literal
 
 from pydantic import BaseModel, Field
 
@@ -14,32 +14,34 @@ from app.schemas.user import UserReadPublic
 
 TaskStatus = Literal["pending", "in_progress", "completed", "cancelled"]
 TaskPriority = Literal["low", "medium", "high", "critical"]
+TaskTitle = Annotated[str, Field(min_length=1, max_length=500)]
+TaskDescription = Annotated[str, Field(max_length=10000)]
 
 
 # ── Create ────────────────────────────────────────────────────────────────────
 
 class TaskCreate(BaseModel):
-    title: str = Field(min_length=1, max_length=500)
-    description: str | None = Field(default=None, max_length=10000)
+    title: TaskTitle
+    description: TaskDescription | None = None
     status: TaskStatus = "pending"
     priority: TaskPriority = "medium"
     due_date: datetime | None = None
     assigned_to_id: uuid.UUID | None = None
     team_id: uuid.UUID | None = None
-    tags: list[str] = Field(default_factory=list, max_length=20)
+    tags: tuple[str, ...] = Field(default=(), max_length=20)
 
 
 # ── Update ────────────────────────────────────────────────────────────────────
 
 class TaskUpdate(BaseModel):
-    title: str | None = Field(default=None, min_length=1, max_length=500)
-    description: str | None = None
+    title: TaskTitle | None = None
+    description: TaskDescription | None = None
     status: TaskStatus | None = None
     priority: TaskPriority | None = None
     due_date: datetime | None = None
     assigned_to_id: uuid.UUID | None = None
     team_id: uuid.UUID | None = None
-    tags: list[str] | None = None
+    tags: tuple[str, ...] | None = Field(default=None, max_length=20)
 
 
 # ── Assign ────────────────────────────────────────────────────────────────────
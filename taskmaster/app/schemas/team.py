@@ -5,24 +5,25 @@ from __future__ import annotations
 
 import uuid
 from datetime import datetime
-from typing import Literal
+from typing import Annotated, Literal
 
 from pydantic import BaseModel, Field
 
 from app.schemas.user import UserReadPublic
 
 TeamMemberRole = Literal["member", "manager"]
+TeamName = Annotated[str, Field(min_length=1, max_length=200)]
 
 
 # ── Team Create / Update / Read ───────────────────────────────────────────────
 
 class TeamCreate(BaseModel):
-    name: str = Field(min_length=1, max_length=200)
+    name: TeamName
     description: str | None = Field(default=None, max_length=1000)
 
 
 class TeamUpdate(BaseModel):
-    name: str | None = Field(default=None, min_length=1, max_length=200)
+    name: TeamName | None = None
     description: str | None = None
 
 
@@ -61,3 +62,8 @@ class TeamMemberRead(BaseModel):
     user: UserReadPublic | None = None
 
     model_config = {"from_attributes": True}
+
+
+# Resolve the "TeamMemberRead" forward reference at import time rather than on
+# the first request that validates a team with members.
+TeamReadWithMembers.model_rebuild()
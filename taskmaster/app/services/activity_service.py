@@ -18,6 +18,27 @@ logger = logging.getLogger(__name__)
 
 class ActivityService:
 
+    def build_entry(
+        self,
+        *,
+        user_id: uuid.UUID,
+        action: str,
+        entity_type: str,
+        entity_id: uuid.UUID,
+        meta: dict[str, Any] | None = None,
+    ) -> ActivityLog:
+        """
+        Build an unpersisted log entry so callers can add it together with
+        their other writes and flush once.
+        """
+        return ActivityLog(
+            user_id=user_id,
+            action=action,
+            entity_type=entity_type,
+            entity_id=entity_id,
+            meta=meta,
+        )
+
     async def log(
         self,
         db: AsyncSession,
@@ -34,7 +55,7 @@ class ActivityService:
         so that a logging failure never breaks the main request flow.
         """
         try:
-            entry = ActivityLog(
+            entry = self.build_entry(
                 user_id=user_id,
                 action=action,
                 entity_type=entity_type,
@@ -41,12 +41,12 @@ class AuthService:
         Validates email/username uniqueness, hashes password, creates user,
         and logs the registration activity.
         """
-        # Check email uniqueness
-        if await crud_user.exists(db, email=user_in.email):
+        email_taken, username_taken = await crud_user.find_conflict(
+            db, email=user_in.email, username=user_in.username
+        )
+        if email_taken:
             raise ConflictException("A user with this email already exists")
-
-        # Check username uniqueness
-        if await crud_user.exists(db, username=user_in.username):
+        if username_taken:
             raise ConflictException("A user with this username already exists")
 
         hashed = hash_password(user_in.password)
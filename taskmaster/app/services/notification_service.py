@@ -1,134 +1,189 @@
 """
 Notification fan-out service.
 Creates DB notification records and pushes real-time messages via WebSocket.
+WebSocket pushes go through an in-process queue drained by a background
+worker, so requests never wait on client sockets.
 """
 from __future__ import annotations
 
+import asyncio
+import logging
 import uuid
+from collections.abc import Iterable
+from datetime import datetime, timedelta, timezone
 from typing import Any
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.config import settings
 from app.crud.notification import crud_notification
+from app.models.notification import Notification
 from app.services.websocket_service import ws_manager
 
+logger = logging.getLogger(__name__)
+
+# Pushes are best-effort: once this many are waiting, new ones are dropped
+# (the notification row is still stored and shows up on the next fetch).
+PUSH_QUEUE_SIZE = 1000
+
 
 class NotificationService:
 
-    async def notify_user(
+    def __init__(self) -> None:
+        self._push_queue: asyncio.Queue[tuple[str, dict[str, Any]]] = asyncio.Queue(
+            maxsize=PUSH_QUEUE_SIZE
+        )
+
+    def build_entry(
         self,
-        db: AsyncSession,
         *,
         user_id: uuid.UUID,
         message: str,
         type: str,
         reference_id: uuid.UUID | None = None,
-    ) -> None:
+    ) -> Notification:
         """
-        Persist a notification to the database and push it via WebSocket
-        if the user is currently connected.
+        Build an unpersisted notification so callers can add it together with
+        their other writes and flush once. Call push() after the flush.
         """
-        notification = await crud_notification.create_notification(
-            db,
+        return Notification(
             user_id=user_id,
             message=message,
             type=type,
             reference_id=reference_id,
         )
 
-        # Push real-time if connected
-        if ws_manager.is_connected(str(user_id)):
+    def push(self, notifications: Iterable[Notification]) -> None:
+        """Queue flushed notifications for recipients that are connected."""
+        for notification in notifications:
+            if not ws_manager.is_connected(notification.user_id):
+                continue
             payload: dict[str, Any] = {
                 "type": "notification",
                 "data": {
-                    "id": str(notification.id),
-                    "message": message,
-                    "notification_type": type,
-                    "reference_id": str(reference_id) if reference_id else None,
+                    "id": notification.id,
+                    "message": notification.message,
+                    "notification_type": notification.type,
+                    "reference_id": notification.reference_id,
                     "is_read": False,
-                    "created_at": notification.created_at.isoformat(),
+                    "created_at": notification.created_at,
                 },
             }
-            await ws_manager.send_personal_message(str(user_id), payload)
+            try:
+                self._push_queue.put_nowait((str(notification.user_id), payload))
+            except asyncio.QueueFull:
+                logger.warning(
+                    "Notification push queue full; dropping push for user_id=%s",
+                    notification.user_id,
+                )
 
-    async def notify_task_assigned(
+    async def run_push_worker(self) -> None:
+        """Deliver queued pushes until cancelled. Started from the app lifespan."""
+        while True:
+            user_id, payload = await self._push_queue.get()
+            try:
+                await ws_manager.send_personal_message(user_id, payload)
+            except Exception as exc:
+                logger.error(
+                    "Failed to push notification to user_id=%s: %s", user_id, exc
+                )
+            finally:
+                self._push_queue.task_done()
+
+    async def find_pending(
         self,
         db: AsyncSession,
         *,
+        user_id: uuid.UUID,
+        type: str,
+        reference_id: uuid.UUID,
+    ) -> Notification | None:
+        """
+        The user's unread notification of this type for the same entity from
+        within NOTIFICATION_COALESCE_SECONDS, if any. Callers refresh it rather
+        than add a new one that would only repeat it.
+        """
+        window = settings.NOTIFICATION_COALESCE_SECONDS
+        if window <= 0:
+            return None
+        return await crud_notification.get_recent_unread(
+            db,
+            user_id=user_id,
+            type=type,
+            reference_id=reference_id,
+            since=datetime.now(timezone.utc) - timedelta(seconds=window),
+        )
+
+    # ── Typed builders ────────────────────────────────────────────────────────
+
+    def task_assigned(
+        self,
+        *,
         assignee_id: uuid.UUID,
         task_id: uuid.UUID,
         task_title: str,
         assigner_name: str,
-    ) -> None:
-        await self.notify_user(
-            db,
+    ) -> Notification:
+        return self.build_entry(
             user_id=assignee_id,
             message=f"{assigner_name} assigned you to task: {task_title!r}",
             type="task_assigned",
             reference_id=task_id,
         )
 
-    async def notify_task_updated(
+    def task_updated(
         self,
-        db: AsyncSession,
         *,
         user_id: uuid.UUID,
         task_id: uuid.UUID,
         task_title: str,
         updater_name: str,
-    ) -> None:
-        await self.notify_user(
-            db,
+    ) -> Notification:
+        return self.build_entry(
             user_id=user_id,
             message=f"{updater_name} updated task: {task_title!r}",
             type="task_updated",
             reference_id=task_id,
         )
 
-    async def notify_comment_added(
+    def comment_added(
         self,
-        db: AsyncSession,
         *,
         task_owner_id: uuid.UUID,
         task_id: uuid.UUID,
         task_title: str,
         commenter_name: str,
-    ) -> None:
-        await self.notify_user(
-            db,
+    ) -> Notification:
+        return self.build_entry(
             user_id=task_owner_id,
             message=f"{commenter_name} commented on task: {task_title!r}",
             type="comment_added",
             reference_id=task_id,
         )
 
-    async def notify_team_invite(
+    def team_invite(
         self,
-        db: AsyncSession,
         *,
         user_id: uuid.UUID,
         team_id: uuid.UUID,
         team_name: str,
         inviter_name: str,
-    ) -> None:
-        await self.notify_user(
-            db,
+    ) -> Notification:
+        return self.build_entry(
             user_id=user_id,
             message=f"{inviter_name} added you to team: {team_name!r}",
             type="team_invite",
             reference_id=team_id,
         )
 
-    async def notify_team_removed(
+    def team_removed(
         self,
-        db: AsyncSession,
         *,
         user_id: uuid.UUID,
         team_id: uuid.UUID,
         team_name: str,
-    ) -> None:
-        await self.notify_user(
-            db,
+    ) -> Notification:
+        return self.build_entry(
             user_id=user_id,
             message=f"You have been removed from team: {team_name!r}",
             type="team_removed",
@@ -11,7 +11,9 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.exceptions import ForbiddenException, NotFoundException
 from app.crud.task import crud_task
 from app.crud.team import crud_team
+from app.models.notification import Notification
 from app.models.task import Task
+from app.models.team import TeamMember
 from app.models.user import User
 from app.schemas.task import TaskCreate, TaskFilter, TaskUpdate
 from app.services.activity_service import activity_service
@@ -45,8 +47,7 @@ class TaskService:
             db, obj_in=task_in, owner_id=current_user.id
         )
 
-        await activity_service.log(
-            db,
+        log_entry = activity_service.build_entry(
             user_id=current_user.id,
             action="task_created",
             entity_type="task",
@@ -55,15 +56,20 @@ class TaskService:
         )
 
         # Notify assignee if different from creator
+        notifications: list[Notification] = []
         if task.assigned_to_id and task.assigned_to_id != current_user.id:
-            await notification_service.notify_task_assigned(
-                db,
-                assignee_id=task.assigned_to_id,
-                task_id=task.id,
-                task_title=task.title,
-                assigner_name=current_user.username,
+            notifications.append(
+                notification_service.task_assigned(
+                    assignee_id=task.assigned_to_id,
+                    task_id=task.id,
+                    task_title=task.title,
+                    assigner_name=current_user.username,
+                )
             )
 
+        db.add_all([log_entry, *notifications])
+        await db.flush()
+        notification_service.push(notifications)
         return task
 
     async def get_task(
@@ -74,11 +80,14 @@ class TaskService:
         current_user: User,
     ) -> Task:
         """Fetch a task, enforcing visibility rules."""
-        task = await crud_task.get_with_relations(db, task_id)
+        # Admins skip every permission check, so their team members are never needed
+        task = await crud_task.get_with_relations(
+            db, task_id, with_members=current_user.role != "admin"
+        )
         if task is None:
             raise NotFoundException("Task", str(task_id))
 
-        await self._assert_can_view(db, task=task, user=current_user)
+        self._assert_can_view(task=task, user=current_user)
         return task
 
     async def update_task(
@@ -90,49 +99,64 @@ class TaskService:
         current_user: User,
     ) -> Task:
         """Update a task. Only owner, team manager, or admin may update."""
-        task = await crud_task.get_with_relations(db, task_id)
+        task = await crud_task.get_with_relations(
+            db, task_id, with_members=current_user.role != "admin"
+        )
         if task is None:
             raise NotFoundException("Task", str(task_id))
 
-        await self._assert_can_modify(db, task=task, user=current_user)
+        self._assert_can_modify(task=task, user=current_user)
 
         old_assignee = task.assigned_to_id
-        updated = await crud_task.update(db, db_obj=task, obj_in=task_in)
+        changes = task_in.model_dump(exclude_unset=True)
+        updated = await crud_task.update(db, db_obj=task, obj_in=changes)
 
-        await activity_service.log(
-            db,
+        log_entry = activity_service.build_entry(
             user_id=current_user.id,
             action="task_updated",
             entity_type="task",
             entity_id=task.id,
-            meta=task_in.model_dump(exclude_unset=True),
+            meta=changes,
         )
 
         # Notify new assignee
+        notifications: list[Notification] = []
         new_assignee = task_in.assigned_to_id
         if (
             new_assignee is not None
             and new_assignee != old_assignee
             and new_assignee != current_user.id
         ):
-            await notification_service.notify_task_assigned(
-                db,
-                assignee_id=new_assignee,
-                task_id=task.id,
-                task_title=task.title,
-                assigner_name=current_user.username,
+            notifications.append(
+                notification_service.task_assigned(
+                    assignee_id=new_assignee,
+                    task_id=task.id,
+                    task_title=task.title,
+                    assigner_name=current_user.username,
+                )
             )
 
-        # Notify owner if someone else updated their task
+        # Notify owner if someone else updated their task. If they have yet to
+        # read a recent notification about the same task, refresh that one so
+        # it names the latest editor and title instead of adding another.
         if task.owner_id != current_user.id:
-            await notification_service.notify_task_updated(
-                db,
+            update_notice = notification_service.task_updated(
                 user_id=task.owner_id,
                 task_id=task.id,
                 task_title=task.title,
                 updater_name=current_user.username,
             )
-
+            pending = await notification_service.find_pending(
+                db, user_id=task.owner_id, type="task_updated", reference_id=task.id
+            )
+            if pending is None:
+                notifications.append(update_notice)
+            else:
+                pending.message = update_notice.message
+
+        db.add_all([log_entry, *notifications])
+        await db.flush()
+        notification_service.push(notifications)
         return updated
 
     async def delete_task(
@@ -143,23 +167,24 @@ class TaskService:
         current_user: User,
     ) -> Task:
         """Soft-delete (archive) a task."""
-        task = await crud_task.get_with_relations(db, task_id)
+        task = await crud_task.get_with_relations(
+            db, task_id, with_members=current_user.role != "admin"
+        )
         if task is None:
             raise NotFoundException("Task", str(task_id))
 
-        await self._assert_can_modify(db, task=task, user=current_user)
-
-        archived = await crud_task.archive(db, task=task)
+        self._assert_can_modify(task=task, user=current_user)
 
-        await activity_service.log(
-            db,
-            user_id=current_user.id,
-            action="task_archived",
-            entity_type="task",
-            entity_id=task.id,
+        # The log entry rides on the archive flush
+        db.add(
+            activity_service.build_entry(
+                user_id=current_user.id,
+                action="task_archived",
+                entity_type="task",
+                entity_id=task.id,
+            )
         )
-
-        return archived
+        return await crud_task.archive(db, task=task)
 
     async def list_tasks(
         self,
@@ -173,12 +198,8 @@ class TaskService:
             # Admins see all tasks
             return await crud_task.list_with_filters(db, filters=filters)
 
-        team_ids = await crud_team.get_user_team_ids(db, user_id=current_user.id)
         return await crud_task.list_with_filters(
-            db,
-            filters=filters,
-            owner_id=current_user.id,
-            team_ids=team_ids,
+            db, filters=filters, user_id=current_user.id
         )
 
     async def assign_task(
@@ -190,27 +211,31 @@ class TaskService:
         current_user: User,
     ) -> Task:
         """Reassign a task to a different user."""
-        task = await crud_task.get_with_relations(db, task_id)
-        if task is None:
-            raise NotFoundException("Task", str(task_id))
-
-        await self._assert_can_modify(db, task=task, user=current_user)
-
-        updated = await crud_task.update(
-            db, db_obj=task, obj_in={"assigned_to_id": assignee_id}
+        task = await crud_task.assign(
+            db,
+            task_id=task_id,
+            assignee_id=assignee_id,
+            actor_id=None if current_user.role == "admin" else current_user.id,
         )
+        if task is None:
+            if await crud_task.get(db, task_id) is None:
+                raise NotFoundException("Task", str(task_id))
+            raise ForbiddenException(
+                "Only the task owner, team manager, or admin can modify this task"
+            )
 
+        notifications: list[Notification] = []
         if assignee_id != current_user.id:
-            await notification_service.notify_task_assigned(
-                db,
-                assignee_id=assignee_id,
-                task_id=task.id,
-                task_title=task.title,
-                assigner_name=current_user.username,
+            notifications.append(
+                notification_service.task_assigned(
+                    assignee_id=assignee_id,
+                    task_id=task.id,
+                    task_title=task.title,
+                    assigner_name=current_user.username,
+                )
             )
 
-        await activity_service.log(
-            db,
+        log_entry = activity_service.build_entry(
             user_id=current_user.id,
             action="task_assigned",
             entity_type="task",
@@ -218,38 +243,39 @@ class TaskService:
             meta={"assigned_to_id": str(assignee_id)},
         )
 
-        return updated
+        db.add_all([*notifications, log_entry])
+        await db.flush()
+        notification_service.push(notifications)
+        return task
 
     # ── Private helpers ───────────────────────────────────────────────────────
 
-    async def _assert_can_view(
-        self, db: AsyncSession, *, task: Task, user: User
-    ) -> None:
+    def _team_member(self, task: Task, user: User) -> TeamMember | None:
+        """Find the user's membership in the task's (preloaded) team."""
+        if task.team is None:
+            return None
+        for member in task.team.members:
+            if member.user_id == user.id:
+                return member
+        return None
+
+    def _assert_can_view(self, *, task: Task, user: User) -> None:
         if user.role == "admin":
             return
         if task.owner_id == user.id or task.assigned_to_id == user.id:
             return
-        if task.team_id is not None:
-            member = await crud_team.get_member(
-                db, team_id=task.team_id, user_id=user.id
-            )
-            if member is not None:
-                return
+        if self._team_member(task, user) is not None:
+            return
         raise ForbiddenException("You do not have access to this task")
 
-    async def _assert_can_modify(
-        self, db: AsyncSession, *, task: Task, user: User
-    ) -> None:
+    def _assert_can_modify(self, *, task: Task, user: User) -> None:
         if user.role == "admin":
             return
         if task.owner_id == user.id:
             return
-        if task.team_id is not None:
-            member = await crud_team.get_member(
-                db, team_id=task.team_id, user_id=user.id
-            )
-            if member is not None and member.role == "manager":
-                return
+        member = self._team_member(task, user)
+        if member is not None and member.role == "manager":
+            return
         raise ForbiddenException(
             "Only the task owner, team manager, or admin can modify this task"
         )
@@ -27,21 +27,17 @@ class TeamService:
         team_in: TeamCreate,
         current_user: User,
     ) -> Team:
-        team = await crud_team.create_team(
-            db, obj_in=team_in, owner_id=current_user.id
-        )
-        # Auto-add owner as manager
-        await crud_team.add_member(
-            db, team_id=team.id, user_id=current_user.id, role="manager"
-        )
-        await activity_service.log(
-            db,
+        # Owner is auto-added as manager; team, membership and log share one flush
+        team = crud_team.build_team(obj_in=team_in, owner_id=current_user.id)
+        log_entry = activity_service.build_entry(
             user_id=current_user.id,
             action="team_created",
             entity_type="team",
             entity_id=team.id,
             meta={"name": team.name},
         )
+        db.add_all([team, log_entry])
+        await db.flush()
         return team
 
     async def get_team(
@@ -54,7 +50,7 @@ class TeamService:
         team = await crud_team.get_with_members(db, team_id)
         if team is None:
             raise NotFoundException("Team", str(team_id))
-        await self._assert_member_or_admin(db, team=team, user=current_user)
+        self._assert_member_or_admin(team=team, user=current_user)
         return team
 
     async def update_team(
@@ -68,17 +64,19 @@ class TeamService:
         team = await crud_team.get(db, team_id)
         if team is None:
             raise NotFoundException("Team", str(team_id))
-        await self._assert_owner_or_admin(team=team, user=current_user)
-        updated = await crud_team.update(db, db_obj=team, obj_in=team_in)
-        await activity_service.log(
-            db,
-            user_id=current_user.id,
-            action="team_updated",
-            entity_type="team",
-            entity_id=team.id,
-            meta=team_in.model_dump(exclude_unset=True),
+        self._assert_owner_or_admin(team=team, user=current_user)
+        changes = team_in.model_dump(exclude_unset=True)
+        # The log entry rides on the update flush
+        db.add(
+            activity_service.build_entry(
+                user_id=current_user.id,
+                action="team_updated",
+                entity_type="team",
+                entity_id=team.id,
+                meta=changes,
+            )
         )
-        return updated
+        return await crud_team.update(db, db_obj=team, obj_in=changes)
 
     async def delete_team(
         self,
@@ -90,15 +88,17 @@ class TeamService:
         team = await crud_team.get(db, team_id)
         if team is None:
             raise NotFoundException("Team", str(team_id))
-        await self._assert_owner_or_admin(team=team, user=current_user)
-        deleted = await crud_team.remove(db, id=team_id)
-        await activity_service.log(
-            db,
-            user_id=current_user.id,
-            action="team_deleted",
-            entity_type="team",
-            entity_id=team_id,
+        self._assert_owner_or_admin(team=team, user=current_user)
+        # The log entry rides on the delete flush
+        db.add(
+            activity_service.build_entry(
+                user_id=current_user.id,
+                action="team_deleted",
+                entity_type="team",
+                entity_id=team_id,
+            )
         )
+        deleted = await crud_team.remove(db, id=team_id)
         return deleted  # type: ignore[return-value]
 
     async def add_member(
@@ -134,22 +134,22 @@ class TeamService:
             role=member_in.role,
         )
 
-        await notification_service.notify_team_invite(
-            db,
+        notification = notification_service.team_invite(
             user_id=member_in.user_id,
             team_id=team_id,
             team_name=team.name,
             inviter_name=current_user.username,
         )
-
-        await activity_service.log(
-            db,
+        log_entry = activity_service.build_entry(
             user_id=current_user.id,
             action="team_member_added",
             entity_type="team",
             entity_id=team_id,
             meta={"user_id": str(member_in.user_id), "role": member_in.role},
         )
+        db.add_all([notification, log_entry])
+        await db.flush()
+        notification_service.push([notification])
 
         return member
 
@@ -175,21 +175,21 @@ class TeamService:
         if removed is None:
             raise NotFoundException("TeamMember")
 
-        await notification_service.notify_team_removed(
-            db,
+        notification = notification_service.team_removed(
             user_id=user_id,
             team_id=team_id,
             team_name=team.name,
         )
-
-        await activity_service.log(
-            db,
+        log_entry = activity_service.build_entry(
             user_id=current_user.id,
             action="team_member_removed",
             entity_type="team",
             entity_id=team_id,
             meta={"user_id": str(user_id)},
         )
+        db.add_all([notification, log_entry])
+        await db.flush()
+        notification_service.push([notification])
 
     async def update_member_role(
         self,
@@ -204,7 +204,7 @@ class TeamService:
         if team is None:
             raise NotFoundException("Team", str(team_id))
 
-        await self._assert_owner_or_admin(team=team, user=current_user)
+        self._assert_owner_or_admin(team=team, user=current_user)
 
         member = await crud_team.update_member_role(
             db, team_id=team_id, user_id=user_id, role=role
@@ -216,13 +216,11 @@ class TeamService:
 
     # ── Private helpers ───────────────────────────────────────────────────────
 
-    async def _assert_member_or_admin(
-        self, db: AsyncSession, *, team: Team, user: User
-    ) -> None:
-        if user.role == "admin":
+    def _assert_member_or_admin(self, *, team: Team, user: User) -> None:
+        """Check against the team's preloaded members; no extra query."""
+        if user.role == "admin" or team.owner_id == user.id:
             return
-        member = await crud_team.get_member(db, team_id=team.id, user_id=user.id)
-        if member is None and team.owner_id != user.id:
+        if not any(member.user_id == user.id for member in team.members):
             raise ForbiddenException("You are not a member of this team")
 
     async def _assert_manager_or_admin(
@@ -5,15 +5,29 @@ Manages active WebSocket connections and provides message broadcasting.
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
+import uuid
 from typing import Any
 
+import orjson
 from fastapi import WebSocket
 
 logger = logging.getLogger(__name__)
 
 
+def _encode(data: dict[str, Any]) -> str:
+    """Encode a message as JSON text; UUIDs and datetimes are handled natively."""
+    return orjson.dumps(data).decode()
+
+
+# Heartbeat frames never change, so encode them once at import
+PING_FRAME = _encode({"type": "ping"})
+
+# A socket that has not accepted a frame within this many seconds is treated
+# as dead and disconnected, so a stalled client cannot hold up other sends.
+SEND_TIMEOUT_SECONDS = 5.0
+
+
 class ConnectionManager:
     """
     Manages active WebSocket connections keyed by user_id (string).
@@ -21,66 +35,75 @@ class ConnectionManager:
     """
 
     def __init__(self) -> None:
-        # user_id → list of active WebSocket connections (a user may have multiple tabs)
-        self._connections: dict[str, list[WebSocket]] = {}
+        # user_id → set of active WebSocket connections (a user may have multiple tabs)
+        self._connections: dict[str, set[WebSocket]] = {}
+        # Users with at least one open connection, for cheap presence checks
+        self._connected_ids: set[uuid.UUID] = set()
+        # websocket → owning user_id, so a socket can be dropped on its own
+        self._ws_user: dict[WebSocket, str] = {}
 
     async def connect(self, websocket: WebSocket, user_id: str) -> None:
         await websocket.accept()
         if user_id not in self._connections:
-            self._connections[user_id] = []
-        self._connections[user_id].append(websocket)
+            self._connected_ids.add(uuid.UUID(user_id))
+        self._connections.setdefault(user_id, set()).add(websocket)
+        self._ws_user[websocket] = user_id
         logger.info("WebSocket connected: user_id=%s", user_id)
 
-    def disconnect(self, websocket: WebSocket, user_id: str) -> None:
-        if user_id in self._connections:
-            try:
-                self._connections[user_id].remove(websocket)
-            except ValueError:
-                pass
-            if not self._connections[user_id]:
-                del self._connections[user_id]
+    def disconnect(self, websocket: WebSocket) -> None:
+        user_id = self._ws_user.pop(websocket, None)
+        if user_id is None:
+            return
+        connections = self._connections[user_id]
+        connections.discard(websocket)
+        if not connections:
+            del self._connections[user_id]
+            self._connected_ids.discard(uuid.UUID(user_id))
         logger.info("WebSocket disconnected: user_id=%s", user_id)
 
-    def is_connected(self, user_id: str) -> bool:
-        return user_id in self._connections and bool(self._connections[user_id])
+    def is_connected(self, user_id: uuid.UUID) -> bool:
+        return user_id in self._connected_ids
 
     async def send_personal_message(
         self, user_id: str, data: dict[str, Any]
     ) -> None:
         """Send a JSON message to all connections for a specific user."""
-        connections = self._connections.get(user_id, [])
+        connections = self._connections.get(user_id)
         if not connections:
             return
-        message = json.dumps(data)
-        dead: list[WebSocket] = []
-        for ws in connections:
-            try:
-                await ws.send_text(message)
-            except Exception:
-                dead.append(ws)
-        for ws in dead:
-            self.disconnect(ws, user_id)
+        await self._deliver(list(connections), _encode(data))
 
     async def broadcast(self, data: dict[str, Any]) -> None:
         """Send a JSON message to every connected client."""
-        message = json.dumps(data)
-        all_dead: list[tuple[WebSocket, str]] = []
-        for user_id, connections in list(self._connections.items()):
-            for ws in connections:
-                try:
-                    await ws.send_text(message)
-                except Exception:
-                    all_dead.append((ws, user_id))
-        for ws, user_id in all_dead:
-            self.disconnect(ws, user_id)
+        targets = list(self._ws_user)
+        if not targets:
+            return
+        await self._deliver(targets, _encode(data))
 
     async def send_ping(self, websocket: WebSocket) -> None:
         """Send a heartbeat ping frame."""
         try:
-            await websocket.send_text(json.dumps({"type": "ping"}))
+            await websocket.send_text(PING_FRAME)
         except Exception:
             pass
 
+    async def _deliver(self, targets: list[WebSocket], message: str) -> None:
+        """
+        Write a pre-encoded message to all targets concurrently, so one slow
+        client does not hold up the rest. Each write is bounded by
+        SEND_TIMEOUT_SECONDS; failed or timed-out sockets are disconnected.
+        """
+        results = await asyncio.gather(
+            *(
+                asyncio.wait_for(ws.send_text(message), SEND_TIMEOUT_SECONDS)
+                for ws in targets
+            ),
+            return_exceptions=True,
+        )
+        for ws, result in zip(targets, results):
+            if isinstance(result, Exception):
+                self.disconnect(ws)
+
     @property
     def connected_user_count(self) -> int:
         return len(self._connections)
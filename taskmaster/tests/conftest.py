@@ -5,17 +5,29 @@ Uses an in-memory SQLite database for fast, isolated tests.
 from __future__ import annotations
 
 import asyncio
-from collections.abc import AsyncGenerator
+import functools
+import uuid
+from collections.abc import AsyncGenerator, Awaitable, Callable, Iterator
 from typing import Any
 
 import pytest
 import pytest_asyncio
+from pytest_asyncio import is_async_test
 from httpx import ASGITransport, AsyncClient
+from sqlalchemy import insert
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
+from app.api.v1.auth import limiter
+from app.core.security import create_access_token, hash_password
 from app.db.base import Base
-from app.db.session import get_db
+from app.db.session import get_db, json_serializer
 from app.main import app
+from app.models.task import Task
+from app.models.user import User
+
+# Every test request comes from the same client address; the login rate
+# limit would otherwise start rejecting the suite after a handful of logins.
+limiter.enabled = False
 
 # ── Test database ─────────────────────────────────────────────────────────────
 TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
@@ -23,6 +35,7 @@ TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
 test_engine = create_async_engine(
     TEST_DATABASE_URL,
     echo=False,
+    json_serializer=json_serializer,
     connect_args={"check_same_thread": False},
 )
 
@@ -35,111 +48,263 @@ TestSessionLocal = async_sessionmaker(
 )
 
 
-@pytest_asyncio.fixture(scope="session")
-def event_loop():
-    """Create a single event loop for the entire test session."""
-    loop = asyncio.new_event_loop()
-    yield loop
-    loop.close()
+def pytest_asyncio_loop_factories(
+    config: pytest.Config, item: pytest.Item
+) -> dict[str, Callable[[], asyncio.AbstractEventLoop]]:
+    """Run the test event loop on uvloop when it is installed."""
+    try:
+        import uvloop
+    except ImportError:
+        return {"asyncio": asyncio.new_event_loop}
+    return {"uvloop": uvloop.new_event_loop}
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    parser.addoption(
+        "--fast",
+        action="store_true",
+        default=False,
+        help="skip tests marked slow (coverage duplicated by simpler tests)",
+    )
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    config.addinivalue_line(
+        "markers", "slow: extra-coverage test skipped when --fast is given"
+    )
+
 
+def pytest_collection_modifyitems(
+    config: pytest.Config, items: list[pytest.Item]
+) -> None:
+    """
+    Run every async test in the session event loop shared by the fixtures,
+    and skip slow tests under --fast.
+    """
+    session_loop = pytest.mark.asyncio(loop_scope="session")
+    skip_slow = pytest.mark.skip(reason="skipped by --fast")
+    fast = config.getoption("--fast")
+    for item in items:
+        if is_async_test(item):
+            item.add_marker(session_loop, append=False)
+        if fast and "slow" in item.keywords:
+            item.add_marker(skip_slow)
 
-@pytest_asyncio.fixture(scope="session", autouse=True)
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session", autouse=True)
 async def create_tables():
-    """Create all tables once per test session."""
+    """Create all tables once per test session and dispose the engine after."""
     async with test_engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
     yield
     async with test_engine.begin() as conn:
         await conn.run_sync(Base.metadata.drop_all)
+    await test_engine.dispose()
 
 
-@pytest_asyncio.fixture
+@pytest_asyncio.fixture(loop_scope="session")
 async def db() -> AsyncGenerator[AsyncSession, None]:
-    """Provide a transactional test database session that rolls back after each test."""
-    async with TestSessionLocal() as session:
+    """
+    Provide a session bound to an outer transaction that is rolled back after
+    each test. Commits inside the test only release a SAVEPOINT.
+    """
+    async with test_engine.connect() as connection:
+        transaction = await connection.begin()
+        session = TestSessionLocal(
+            bind=connection, join_transaction_mode="create_savepoint"
+        )
         try:
             yield session
-            await session.rollback()
         finally:
             await session.close()
+            await transaction.rollback()
 
 
-@pytest_asyncio.fixture
-async def client(db: AsyncSession) -> AsyncGenerator[AsyncClient, None]:
-    """Provide an async HTTP test client with the test DB injected."""
-
-    async def override_get_db() -> AsyncGenerator[AsyncSession, None]:
-        yield db
-
-    app.dependency_overrides[get_db] = override_get_db
-
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def http_client() -> AsyncGenerator[AsyncClient, None]:
+    """One ASGI transport and client shared by the whole session."""
     async with AsyncClient(
         transport=ASGITransport(app=app),
         base_url="http://test",
     ) as ac:
         yield ac
 
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def client(
+    http_client: AsyncClient, db: AsyncSession
+) -> AsyncGenerator[AsyncClient, None]:
+    """Provide the shared HTTP test client with this test's DB session injected."""
+
+    async def override_get_db() -> AsyncGenerator[AsyncSession, None]:
+        yield db
+
+    app.dependency_overrides[get_db] = override_get_db
+    yield http_client
     app.dependency_overrides.clear()
 
 
 # ── Helper fixtures ───────────────────────────────────────────────────────────
+# The standard user and the admin are inserted and committed once per session;
+# each test's outer-transaction rollback undoes whatever it does to them.
+# Access tokens are minted in-process instead of going through /auth/login.
+
+# bcrypt is deliberately slow, so each distinct test password is hashed once
+# and the result reused; factory-made users all share DEFAULT_PASSWORD's hash.
+@functools.cache
+def _cached_hash(plain_password: str) -> str:
+    return hash_password(plain_password)
 
-@pytest_asyncio.fixture
-async def registered_user(client: AsyncClient) -> dict[str, Any]:
-    """Register and return a standard user."""
-    response = await client.post(
-        "/api/v1/auth/register",
-        json={
-            "email": "testuser@example.com",
-            "username": "testuser",
-            "password": "TestPass1",
-            "full_name": "Test User",
-        },
+
+DEFAULT_PASSWORD = "TestPass1"
+_DEFAULT_PASSWORD_HASH = _cached_hash(DEFAULT_PASSWORD)
+
+UserFactory = Callable[..., Awaitable[dict[str, Any]]]
+TaskSeeder = Callable[[str, list[dict[str, Any]]], Awaitable[list[uuid.UUID]]]
+BulkSeeder = Callable[[type[Base], list[dict[str, Any]]], Awaitable[None]]
+
+
+@pytest.fixture(scope="session", autouse=True)
+def memoized_password_hashing() -> Iterator[None]:
+    """Route the app's password hashing through the cache for the session."""
+    with pytest.MonkeyPatch.context() as mp:
+        for module in ("app.services.auth_service", "app.api.v1.users"):
+            mp.setattr(f"{module}.hash_password", _cached_hash)
+        yield
+
+
+async def _insert_user(
+    *, email: str, username: str, password: str, full_name: str, role: str = "user"
+) -> dict[str, Any]:
+    user = User(
+        email=email,
+        username=username,
+        hashed_password=_cached_hash(password),
+        full_name=full_name,
+        role=role,
+        is_active=True,
+        is_verified=role == "admin",
     )
-    assert response.status_code == 201, response.text
-    return response.json()
+    async with TestSessionLocal() as session:
+        session.add(user)
+        await session.commit()
+    return {"id": str(user.id), "email": user.email, "username": user.username}
 
 
-@pytest_asyncio.fixture
-async def auth_headers(client: AsyncClient, registered_user: dict) -> dict[str, str]:
-    """Return Authorization headers for the registered test user."""
-    response = await client.post(
-        "/api/v1/auth/login",
-        json={"email": "testuser@example.com", "password": "TestPass1"},
+def _bearer(user: dict[str, Any], role: str) -> dict[str, str]:
+    return {"Authorization": f"Bearer {create_access_token(user['id'], role)}"}
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def registered_user() -> dict[str, Any]:
+    """Return the standard test user, created once per session."""
+    return await _insert_user(
+        email="testuser@example.com",
+        username="testuser",
+        password="TestPass1",
+        full_name="Test User",
     )
-    assert response.status_code == 200, response.text
-    token = response.json()["access_token"]
-    return {"Authorization": f"Bearer {token}"}
 
 
-@pytest_asyncio.fixture
-async def registered_admin(client: AsyncClient, db: AsyncSession) -> dict[str, Any]:
-    """Register an admin user directly via the DB."""
-    from app.core.security import hash_password
-    from app.models.user import User
+@pytest.fixture(scope="session")
+def auth_headers(registered_user: dict[str, Any]) -> dict[str, str]:
+    """Return Authorization headers for the registered test user."""
+    return _bearer(registered_user, "user")
+
 
-    admin = User(
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def registered_admin() -> dict[str, Any]:
+    """Return the admin user, created once per session."""
+    return await _insert_user(
         email="admin@example.com",
         username="adminuser",
-        hashed_password=hash_password("AdminPass1"),
+        password="AdminPass1",
         full_name="Admin User",
         role="admin",
-        is_active=True,
-        is_verified=True,
     )
-    db.add(admin)
-    await db.flush()
-    await db.refresh(admin)
-    return {"id": str(admin.id), "email": admin.email, "username": admin.username}
 
 
-@pytest_asyncio.fixture
-async def admin_headers(client: AsyncClient, registered_admin: dict) -> dict[str, str]:
+@pytest.fixture(scope="session")
+def admin_headers(registered_admin: dict[str, Any]) -> dict[str, str]:
     """Return Authorization headers for the admin user."""
-    response = await client.post(
-        "/api/v1/auth/login",
-        json={"email": "admin@example.com", "password": "AdminPass1"},
-    )
-    assert response.status_code == 200, response.text
-    token = response.json()["access_token"]
-    return {"Authorization": f"Bearer {token}"}
+    return _bearer(registered_admin, "admin")
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def auth_http_client(
+    auth_headers: dict[str, str],
+) -> AsyncGenerator[AsyncClient, None]:
+    """A second shared client with the standard user's token preset."""
+    async with AsyncClient(
+        transport=ASGITransport(app=app),
+        base_url="http://test",
+        headers=auth_headers,
+    ) as ac:
+        yield ac
+
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def auth_client(
+    auth_http_client: AsyncClient, client: AsyncClient
+) -> AsyncClient:
+    """
+    Provide the pre-authenticated client; depending on client installs this
+    test's DB session override.
+    """
+    return auth_http_client
+
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def user_factory(db: AsyncSession) -> UserFactory:
+    """
+    Return a coroutine that inserts an extra user into this test's session.
+    The user disappears with the test's rollback; its password is
+    DEFAULT_PASSWORD and the returned dict carries ready-made auth headers.
+    """
+
+    async def make_user(
+        email: str, username: str, *, role: str = "user"
+    ) -> dict[str, Any]:
+        user = User(
+            email=email,
+            username=username,
+            hashed_password=_DEFAULT_PASSWORD_HASH,
+            role=role,
+            is_active=True,
+        )
+        db.add(user)
+        await db.flush()
+        created = {"id": str(user.id), "email": user.email, "username": user.username}
+        created["headers"] = _bearer(created, role)
+        return created
+
+    return make_user
+
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def bulk_seed(db: AsyncSession) -> BulkSeeder:
+    """
+    Return a coroutine that inserts rows of one model into this test's session
+    as a single executemany INSERT, bypassing the HTTP layer for setup data.
+    """
+
+    async def seed(model: type[Base], rows: list[dict[str, Any]]) -> None:
+        await db.execute(insert(model), rows)
+
+    return seed
+
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def seed_tasks(bulk_seed: BulkSeeder) -> TaskSeeder:
+    """
+    Return a coroutine that bulk-inserts tasks owned by one user.
+    Each spec holds Task columns; the new task ids are returned in order.
+    """
+
+    async def seed(owner_id: str, specs: list[dict[str, Any]]) -> list[uuid.UUID]:
+        owner = uuid.UUID(owner_id)
+        rows = [{"id": uuid.uuid4(), "owner_id": owner, **spec} for spec in specs]
+        await bulk_seed(Task, rows)
+        return [row["id"] for row in rows]
+
+    return seed
@@ -0,0 +1,70 @@
+"""
+Notification push tests.
+Covers: the WebSocket push worker with a stalled client socket.
+"""
+from __future__ import annotations
+
+import asyncio
+import uuid
+
+import pytest
+
+from app.models.notification import Notification
+from app.services import websocket_service
+from app.services.notification_service import NotificationService
+from app.services.websocket_service import ws_manager
+
+pytestmark = pytest.mark.asyncio
+
+
+class _FakeSocket:
+    """Stands in for a WebSocket; a hanging one never finishes a send."""
+
+    def __init__(self, *, hang: bool = False) -> None:
+        self.hang = hang
+        self.sent: list[str] = []
+        self.delivered = asyncio.Event()
+
+    async def accept(self) -> None:
+        pass
+
+    async def send_text(self, message: str) -> None:
+        if self.hang:
+            await asyncio.Event().wait()
+        self.sent.append(message)
+        self.delivered.set()
+
+
+def _notification(user_id: uuid.UUID) -> Notification:
+    return Notification(
+        id=uuid.uuid4(),
+        user_id=user_id,
+        message="pushed",
+        type="task_updated",
+        reference_id=uuid.uuid4(),
+    )
+
+
+async def test_stalled_socket_does_not_block_other_pushes(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(websocket_service, "SEND_TIMEOUT_SECONDS", 0.05)
+    stalled_id, healthy_id = uuid.uuid4(), uuid.uuid4()
+    stalled, healthy = _FakeSocket(hang=True), _FakeSocket()
+    await ws_manager.connect(stalled, str(stalled_id))
+    await ws_manager.connect(healthy, str(healthy_id))
+
+    service = NotificationService()
+    worker = asyncio.create_task(service.run_push_worker())
+    try:
+        service.push([_notification(stalled_id), _notification(healthy_id)])
+        await asyncio.wait_for(healthy.delivered.wait(), timeout=2)
+        # The stalled socket was dropped once its send timed out
+        assert not ws_manager.is_connected(stalled_id)
+    finally:
+        worker.cancel()
+        ws_manager.disconnect(stalled)
+        ws_manager.disconnect(healthy)
+
+    assert len(healthy.sent) == 1
+    assert stalled.sent == []
@@ -1,16 +1,38 @@
 """
 Task endpoint tests.
-Covers: create, read, update, delete (archive), filter, pagination, unauthorized access.
+Covers: create, read, update, delete (archive), filter, pagination, assignment,
+unauthorized access.
 """
 from __future__ import annotations
 
-from typing import Any
+import uuid
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any
 
 import pytest
-from httpx import AsyncClient
+import pytest_asyncio
+from httpx import URL, AsyncClient, Response
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.models.notification import Notification
+from app.models.task import Task
+from app.models.team import Team, TeamMember
+
+if TYPE_CHECKING:
+    from tests.conftest import TaskSeeder, UserFactory
 
 pytestmark = pytest.mark.asyncio
 
+# Parsed once; per-task URLs are joined onto TASKS_URL.
+TASKS_URL = URL("/api/v1/tasks/")
+TASKS_PAGE_1_SIZE_2 = URL("/api/v1/tasks/?page=1&size=2")
+
+
+def _task_url(task_id: str | uuid.UUID) -> URL:
+    return TASKS_URL.join(str(task_id))
+
 
 async def _create_task(
     client: AsyncClient,
@@ -25,17 +47,88 @@ async def _create_task(
         "priority": "medium",
         **kwargs,
     }
-    response = await client.post("/api/v1/tasks/", json=payload, headers=headers)
+    response = await client.post(TASKS_URL, json=payload, headers=headers)
     assert response.status_code == 201, response.text
     return response.json()
 
 
+async def _assign_task(
+    client: AsyncClient, task_id: str | uuid.UUID, headers: dict, assignee_id: str
+) -> Response:
+    return await client.post(
+        TASKS_URL.join(f"{task_id}/assign"),
+        json={"assigned_to_id": assignee_id},
+        headers=headers,
+    )
+
+
+async def _owner_update_notifications(
+    db: AsyncSession, owner_id: str, task_id: uuid.UUID
+) -> list[Notification]:
+    result = await db.execute(
+        select(Notification).where(
+            Notification.user_id == uuid.UUID(owner_id),
+            Notification.type == "task_updated",
+            Notification.reference_id == task_id,
+        )
+    )
+    return list(result.scalars().all())
+
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def seeded_tasks(
+    registered_user: dict, seed_tasks: TaskSeeder
+) -> list[uuid.UUID]:
+    """Insert one task set that covers every list-filter case."""
+    return await seed_tasks(
+        registered_user["id"],
+        [
+            {"title": "Pending Task", "status": "pending"},
+            {"title": "Completed Task", "status": "completed"},
+            {"title": "Critical Task", "priority": "critical"},
+            {"title": "Unique Searchable Title XYZ"},
+            {"title": "Another Task"},
+        ],
+    )
+
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def team_task(
+    db: AsyncSession,
+    registered_user: dict,
+    user_factory: UserFactory,
+    seed_tasks: TaskSeeder,
+) -> tuple[uuid.UUID, dict[str, Any], dict[str, Any]]:
+    """
+    Insert a task owned by the standard user inside a team that also has a
+    second manager and a plain member. Returns (task_id, manager, member).
+    """
+    manager = await user_factory("manager@example.com", "teammanager")
+    member = await user_factory("plainmember@example.com", "plainmember")
+    owner_id = uuid.UUID(registered_user["id"])
+    team = Team(
+        name="Assignment Team",
+        owner_id=owner_id,
+        members=[
+            TeamMember(user_id=owner_id, role="manager"),
+            TeamMember(user_id=uuid.UUID(manager["id"]), role="manager"),
+            TeamMember(user_id=uuid.UUID(member["id"]), role="member"),
+        ],
+    )
+    db.add(team)
+    await db.flush()
+    [task_id] = await seed_tasks(
+        registered_user["id"], [{"title": "Team Task", "team_id": team.id}]
+    )
+    return task_id, manager, member
+
+
 class TestCreateTask:
     async def test_create_task_success(
         self, client: AsyncClient, auth_headers: dict
     ) -> None:
         response = await client.post(
-            "/api/v1/tasks/",
+            TASKS_URL,
             json={
                 "title": "My First Task",
                 "description": "Do something important",
@@ -55,7 +148,7 @@ class TestCreateTask:
 
     async def test_create_task_unauthenticated(self, client: AsyncClient) -> None:
         response = await client.post(
-            "/api/v1/tasks/",
+            TASKS_URL,
             json={"title": "Unauthorized Task", "status": "pending", "priority": "low"},
         )
         assert response.status_code == 401
@@ -64,7 +157,7 @@ class TestCreateTask:
         self, client: AsyncClient, auth_headers: dict
     ) -> None:
         response = await client.post(
-            "/api/v1/tasks/",
+            TASKS_URL,
             json={"status": "pending", "priority": "low"},
             headers=auth_headers,
         )
@@ -77,7 +170,7 @@ class TestGetTask:
     ) -> None:
         task = await _create_task(client, auth_headers, title="Readable Task")
         response = await client.get(
-            f"/api/v1/tasks/{task['id']}", headers=auth_headers
+            _task_url(task["id"]), headers=auth_headers
         )
         assert response.status_code == 200
         assert response.json()["id"] == task["id"]
@@ -86,7 +179,7 @@ class TestGetTask:
         self, client: AsyncClient, auth_headers: dict
     ) -> None:
         fake_id = "00000000-0000-0000-0000-000000000000"
-        response = await client.get(f"/api/v1/tasks/{fake_id}", headers=auth_headers)
+        response = await client.get(_task_url(fake_id), headers=auth_headers)
         assert response.status_code == 404
 
 
@@ -96,7 +189,7 @@ class TestUpdateTask:
     ) -> None:
         task = await _create_task(client, auth_headers, title="Update Me")
         response = await client.put(
-            f"/api/v1/tasks/{task['id']}",
+            _task_url(task["id"]),
             json={"title": "Updated Title", "status": "in_progress"},
             headers=auth_headers,
         )
@@ -106,61 +199,129 @@ class TestUpdateTask:
         assert data["status"] == "in_progress"
 
     async def test_update_task_unauthorized(
-        self, client: AsyncClient, auth_headers: dict
+        self, client: AsyncClient, auth_headers: dict, user_factory: UserFactory
     ) -> None:
         """A second user should not be able to update another user's task."""
         task = await _create_task(client, auth_headers, title="Owner Task")
 
-        # Register a second user
-        await client.post(
-            "/api/v1/auth/register",
-            json={
-                "email": "other@example.com",
-                "username": "otheruser",
-                "password": "OtherPass1",
-            },
-        )
-        login_resp = await client.post(
-            "/api/v1/auth/login",
-            json={"email": "other@example.com", "password": "OtherPass1"},
-        )
-        other_headers = {"Authorization": f"Bearer {login_resp.json()['access_token']}"}
+        # Create a second user, token minted in-process
+        other = await user_factory("other@example.com", "otheruser")
+        other_headers = other["headers"]
 
         response = await client.put(
-            f"/api/v1/tasks/{task['id']}",
+            _task_url(task["id"]),
             json={"title": "Hijacked"},
             headers=other_headers,
         )
         assert response.status_code == 403
 
+    async def test_repeat_updates_coalesce_owner_notification(
+        self,
+        client: AsyncClient,
+        db: AsyncSession,
+        registered_user: dict,
+        team_task: tuple[uuid.UUID, dict[str, Any], dict[str, Any]],
+    ) -> None:
+        """A second update inside the window refreshes the owner's notification."""
+        task_id, manager, _ = team_task
+        for title in ("First Edit", "Second Edit"):
+            response = await client.put(
+                _task_url(task_id), json={"title": title}, headers=manager["headers"]
+            )
+            assert response.status_code == 200
+        notifications = await _owner_update_notifications(
+            db, registered_user["id"], task_id
+        )
+        assert len(notifications) == 1
+        assert notifications[0].message == "teammanager updated task: 'Second Edit'"
+
+        # Once the owner has read it, the next update notifies again
+        notifications[0].is_read = True
+        await db.flush()
+        response = await client.put(
+            _task_url(task_id), json={"title": "Third Edit"}, headers=manager["headers"]
+        )
+        assert response.status_code == 200
+        notifications = await _owner_update_notifications(
+            db, registered_user["id"], task_id
+        )
+        assert len(notifications) == 2
+
+    async def test_coalesced_notification_names_latest_updater(
+        self,
+        client: AsyncClient,
+        db: AsyncSession,
+        registered_user: dict,
+        admin_headers: dict,
+        team_task: tuple[uuid.UUID, dict[str, Any], dict[str, Any]],
+    ) -> None:
+        """An edit by a different user is not dropped behind the first one."""
+        task_id, manager, _ = team_task
+        response = await client.put(
+            _task_url(task_id), json={"title": "Manager Edit"}, headers=manager["headers"]
+        )
+        assert response.status_code == 200
+        response = await client.put(
+            _task_url(task_id), json={"title": "Admin Edit"}, headers=admin_headers
+        )
+        assert response.status_code == 200
+
+        notifications = await _owner_update_notifications(
+            db, registered_user["id"], task_id
+        )
+        assert len(notifications) == 1
+        assert notifications[0].message == "adminuser updated task: 'Admin Edit'"
+
+    async def test_owner_notified_every_update_when_coalescing_off(
+        self,
+        client: AsyncClient,
+        db: AsyncSession,
+        registered_user: dict,
+        team_task: tuple[uuid.UUID, dict[str, Any], dict[str, Any]],
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        monkeypatch.setattr(settings, "NOTIFICATION_COALESCE_SECONDS", 0)
+        task_id, manager, _ = team_task
+        for title in ("First Edit", "Second Edit"):
+            response = await client.put(
+                _task_url(task_id), json={"title": title}, headers=manager["headers"]
+            )
+            assert response.status_code == 200
+        notifications = await _owner_update_notifications(
+            db, registered_user["id"], task_id
+        )
+        assert len(notifications) == 2
+
 
 class TestDeleteTask:
     async def test_archive_task_success(
-        self, client: AsyncClient, auth_headers: dict
+        self, client: AsyncClient, auth_headers: dict, db: AsyncSession
     ) -> None:
         task = await _create_task(client, auth_headers, title="Archive Me")
         response = await client.delete(
-            f"/api/v1/tasks/{task['id']}", headers=auth_headers
+            _task_url(task["id"]), headers=auth_headers
         )
         assert response.status_code == 204
 
-        # Verify it's archived (not returned in default list)
-        list_resp = await client.get("/api/v1/tasks/", headers=auth_headers)
-        ids = [t["id"] for t in list_resp.json()["items"]]
-        assert task["id"] not in ids
+        # Verify it's archived rather than deleted
+        row = await db.get(Task, uuid.UUID(task["id"]), populate_existing=True)
+        assert row is not None
+        assert row.is_archived is True
 
 
 class TestListTasks:
     async def test_list_tasks_pagination(
-        self, client: AsyncClient, auth_headers: dict
+        self,
+        auth_client: AsyncClient,
+        registered_user: dict,
+        seed_tasks: TaskSeeder,
     ) -> None:
-        # Create 3 tasks
-        for i in range(3):
-            await _create_task(client, auth_headers, title=f"Paginated Task {i}")
-
-        response = await client.get(
-            "/api/v1/tasks/?page=1&size=2", headers=auth_headers
+        await seed_tasks(
+            registered_user["id"],
+            [{"title": f"Paginated Task {i}"} for i in range(3)],
         )
+
+        response = await auth_client.get(TASKS_PAGE_1_SIZE_2)
         assert response.status_code == 200
         data = response.json()
         assert "items" in data
@@ -168,43 +329,89 @@ class TestListTasks:
         assert "pages" in data
         assert len(data["items"]) <= 2
 
-    async def test_list_tasks_filter_by_status(
-        self, client: AsyncClient, auth_headers: dict
+    @pytest.mark.parametrize(
+        ("query", "check"),
+        [
+            ("status=completed", lambda t: t["status"] == "completed"),
+            ("priority=critical", lambda t: t["priority"] == "critical"),
+            ("search=XYZ", lambda t: "XYZ" in t["title"]),
+        ],
+        ids=["status", "priority", "search"],
+    )
+    async def test_list_tasks_filter(
+        self,
+        auth_client: AsyncClient,
+        seeded_tasks: list[uuid.UUID],
+        query: str,
+        check: Callable[[dict], bool],
     ) -> None:
-        await _create_task(client, auth_headers, title="Pending Task", status="pending")
-        await _create_task(
-            client, auth_headers, title="Completed Task", status="completed"
-        )
+        response = await auth_client.get(TASKS_URL, params=query)
+        assert response.status_code == 200
+        items = response.json()["items"]
+        assert len(items) >= 1
+        assert all(check(t) for t in items)
 
-        response = await client.get(
-            "/api/v1/tasks/?status=completed", headers=auth_headers
+
+class TestAssignTask:
+    async def test_assign_as_owner(
+        self, client: AsyncClient, auth_headers: dict, registered_user: dict
+    ) -> None:
+        task = await _create_task(client, auth_headers, title="Owned Task")
+        response = await _assign_task(
+            client, task["id"], auth_headers, registered_user["id"]
         )
         assert response.status_code == 200
-        items = response.json()["items"]
-        assert all(t["status"] == "completed" for t in items)
+        data = response.json()
+        assert data["assigned_to_id"] == registered_user["id"]
+        assert data["assignee"]["id"] == registered_user["id"]
 
-    async def test_list_tasks_search(
-        self, client: AsyncClient, auth_headers: dict
+    async def test_assign_as_non_owner_forbidden(
+        self, client: AsyncClient, auth_headers: dict, user_factory: UserFactory
     ) -> None:
-        await _create_task(client, auth_headers, title="Unique Searchable Title XYZ")
-        await _create_task(client, auth_headers, title="Another Task")
+        task = await _create_task(client, auth_headers, title="Not Yours")
+        other = await user_factory("outsider@example.com", "outsider")
+        response = await _assign_task(client, task["id"], other["headers"], other["id"])
+        assert response.status_code == 403
 
-        response = await client.get(
-            "/api/v1/tasks/?search=XYZ", headers=auth_headers
+    async def test_assign_unknown_task(
+        self, client: AsyncClient, auth_headers: dict, registered_user: dict
+    ) -> None:
+        response = await _assign_task(
+            client, uuid.uuid4(), auth_headers, registered_user["id"]
+        )
+        assert response.status_code == 404
+
+    async def test_assign_as_team_manager(
+        self,
+        client: AsyncClient,
+        team_task: tuple[uuid.UUID, dict[str, Any], dict[str, Any]],
+    ) -> None:
+        task_id, manager, member = team_task
+        response = await _assign_task(
+            client, task_id, manager["headers"], member["id"]
         )
         assert response.status_code == 200
-        items = response.json()["items"]
-        assert len(items) >= 1
-        assert any("XYZ" in t["title"] for t in items)
+        assert response.json()["assigned_to_id"] == member["id"]
 
-    async def test_list_tasks_filter_by_priority(
-        self, client: AsyncClient, auth_headers: dict
+    async def test_assign_as_plain_team_member_forbidden(
+        self,
+        client: AsyncClient,
+        team_task: tuple[uuid.UUID, dict[str, Any], dict[str, Any]],
     ) -> None:
-        await _create_task(client, auth_headers, title="Critical Task", priority="critical")
+        task_id, _, member = team_task
+        response = await _assign_task(client, task_id, member["headers"], member["id"])
+        assert response.status_code == 403
 
-        response = await client.get(
-            "/api/v1/tasks/?priority=critical", headers=auth_headers
+    async def test_assign_as_admin(
+        self,
+        client: AsyncClient,
+        auth_headers: dict,
+        admin_headers: dict,
+        registered_admin: dict,
+    ) -> None:
+        task = await _create_task(client, auth_headers, title="Admin Reassigns")
+        response = await _assign_task(
+            client, task["id"], admin_headers, registered_admin["id"]
         )
         assert response.status_code == 200
-        items = response.json()["items"]
-        assert all(t["priority"] == "critical" for t in items)
+        assert response.json()["assigned_to_id"] == registered_admin["id"]
@@ -4,27 +4,28 @@ Covers: create team, add/remove member, team task access, role enforcement.
 """
 from __future__ import annotations
 
-from typing import Any
+import uuid
+from typing import TYPE_CHECKING, Any
 
 import pytest
+import pytest_asyncio
 from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.team import Team, TeamMember
+
+if TYPE_CHECKING:
+    from tests.conftest import BulkSeeder, UserFactory
 
 pytestmark = pytest.mark.asyncio
 
 
 async def _register_and_login(
-    client: AsyncClient, email: str, username: str, password: str = "TestPass1"
-) -> dict[str, str]:
-    await client.post(
-        "/api/v1/auth/register",
-        json={"email": email, "username": username, "password": password},
-    )
-    resp = await client.post(
-        "/api/v1/auth/login",
-        json={"email": email, "password": password},
-    )
-    token = resp.json()["access_token"]
-    return {"Authorization": f"Bearer {token}"}
+    user_factory: UserFactory, email: str, username: str
+) -> tuple[str, dict[str, str]]:
+    """Create a user and return its id alongside its auth headers."""
+    user = await user_factory(email, username)
+    return user["id"], user["headers"]
 
 
 async def _create_team(
@@ -39,6 +40,30 @@ async def _create_team(
     return resp.json()
 
 
+@pytest_asyncio.fixture(loop_scope="session")
+async def team_with_member(
+    db: AsyncSession, registered_user: dict, user_factory: UserFactory
+) -> tuple[str, str, dict[str, str]]:
+    """
+    Insert a team owned by the standard user with one extra plain member.
+    Returns (team_id, member_id, member_headers).
+    """
+    member = await user_factory("teammate@example.com", "teammate")
+    owner_id = uuid.UUID(registered_user["id"])
+    member_id = uuid.UUID(member["id"])
+    team = Team(
+        name="Staffed Team",
+        owner_id=owner_id,
+        members=[
+            TeamMember(user_id=owner_id, role="manager"),
+            TeamMember(user_id=member_id, role="member"),
+        ],
+    )
+    db.add(team)
+    await db.flush()
+    return str(team.id), member["id"], member["headers"]
+
+
 class TestCreateTeam:
     async def test_create_team_success(
         self, client: AsyncClient, auth_headers: dict
@@ -74,14 +99,15 @@ class TestGetTeam:
         assert data["id"] == team["id"]
         assert "members" in data
 
+    @pytest.mark.slow
     async def test_get_team_not_member(
-        self, client: AsyncClient, auth_headers: dict
+        self, client: AsyncClient, auth_headers: dict, user_factory: UserFactory
     ) -> None:
         team = await _create_team(client, auth_headers, name="Private Team")
 
         # Register a non-member
-        other_headers = await _register_and_login(
-            client, "nonmember@example.com", "nonmember"
+        _, other_headers = await _register_and_login(
+            user_factory, "nonmember@example.com", "nonmember"
         )
         response = await client.get(
             f"/api/v1/teams/{team['id']}", headers=other_headers
@@ -91,27 +117,14 @@ class TestGetTeam:
 
 class TestAddMember:
     async def test_add_member_success(
-        self, client: AsyncClient, auth_headers: dict
+        self, client: AsyncClient, auth_headers: dict, user_factory: UserFactory
     ) -> None:
         team = await _create_team(client, auth_headers, name="Growing Team")
 
-        # Register a second user to add
-        await client.post(
-            "/api/v1/auth/register",
-            json={
-                "email": "member2@example.com",
-                "username": "member2",
-                "password": "MemberPass1",
-            },
+        # Create a second user to add
+        member_id, _ = await _register_and_login(
+            user_factory, "member3@example.com", "member3"
         )
-        # Get the user ID
-        me_resp = await client.get("/api/v1/users/me", headers=auth_headers)
-        # We need the second user's ID — get it via admin or by registering and logging in
-        member_headers = await _register_and_login(
-            client, "member3@example.com", "member3"
-        )
-        member_me = await client.get("/api/v1/users/me", headers=member_headers)
-        member_id = member_me.json()["id"]
 
         response = await client.post(
             f"/api/v1/teams/{team['id']}/members",
@@ -123,26 +136,18 @@ class TestAddMember:
         assert data["user_id"] == member_id
         assert data["role"] == "member"
 
+    @pytest.mark.slow
     async def test_add_duplicate_member(
-        self, client: AsyncClient, auth_headers: dict
+        self,
+        client: AsyncClient,
+        auth_headers: dict,
+        team_with_member: tuple[str, str, dict[str, str]],
     ) -> None:
-        team = await _create_team(client, auth_headers, name="Duplicate Test Team")
+        team_id, member_id, _ = team_with_member
 
-        member_headers = await _register_and_login(
-            client, "dup_member@example.com", "dup_member"
-        )
-        member_me = await client.get("/api/v1/users/me", headers=member_headers)
-        member_id = member_me.json()["id"]
-
-        # Add once
-        await client.post(
-            f"/api/v1/teams/{team['id']}/members",
-            json={"user_id": member_id, "role": "member"},
-            headers=auth_headers,
-        )
-        # Add again — should conflict
+        # Already a member — should conflict
         response = await client.post(
-            f"/api/v1/teams/{team['id']}/members",
+            f"/api/v1/teams/{team_id}/members",
             json={"user_id": member_id, "role": "member"},
             headers=auth_headers,
         )
@@ -150,25 +155,17 @@ class TestAddMember:
 
 
 class TestRemoveMember:
+    @pytest.mark.slow
     async def test_remove_member_success(
-        self, client: AsyncClient, auth_headers: dict
+        self,
+        client: AsyncClient,
+        auth_headers: dict,
+        team_with_member: tuple[str, str, dict[str, str]],
     ) -> None:
-        team = await _create_team(client, auth_headers, name="Shrinking Team")
-
-        member_headers = await _register_and_login(
-            client, "removable@example.com", "removable"
-        )
-        member_me = await client.get("/api/v1/users/me", headers=member_headers)
-        member_id = member_me.json()["id"]
-
-        await client.post(
-            f"/api/v1/teams/{team['id']}/members",
-            json={"user_id": member_id, "role": "member"},
-            headers=auth_headers,
-        )
+        team_id, member_id, _ = team_with_member
 
         response = await client.delete(
-            f"/api/v1/teams/{team['id']}/members/{member_id}",
+            f"/api/v1/teams/{team_id}/members/{member_id}",
             headers=auth_headers,
         )
         assert response.status_code == 204
@@ -176,10 +173,20 @@ class TestRemoveMember:
 
 class TestListMyTeams:
     async def test_list_my_teams(
-        self, client: AsyncClient, auth_headers: dict
+        self,
+        client: AsyncClient,
+        auth_headers: dict,
+        registered_user: dict,
+        bulk_seed: BulkSeeder,
     ) -> None:
-        await _create_team(client, auth_headers, name="My Team A")
-        await _create_team(client, auth_headers, name="My Team B")
+        owner_id = uuid.UUID(registered_user["id"])
+        await bulk_seed(
+            Team,
+            [
+                {"name": "My Team A", "owner_id": owner_id},
+                {"name": "My Team B", "owner_id": owner_id},
+            ],
+        )
 
         response = await client.get("/api/v1/teams/", headers=auth_headers)
         assert response.status_code == 200
@@ -202,12 +209,12 @@ class TestUpdateTeam:
         assert response.json()["name"] == "New Name"
 
     async def test_update_team_non_owner_forbidden(
-        self, client: AsyncClient, auth_headers: dict
+        self, client: AsyncClient, auth_headers: dict, user_factory: UserFactory
     ) -> None:
         team = await _create_team(client, auth_headers, name="Protected Team")
 
-        other_headers = await _register_and_login(
-            client, "intruder@example.com", "intruder"
+        _, other_headers = await _register_and_login(
+            user_factory, "intruder@example.com", "intruder"
         )
         response = await client.put(
             f"/api/v1/teams/{team['id']}",